@@ -1,11 +1,21 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, g, render_template, request, jsonify
 from flask_cors import CORS
-import mysql.connector
 from datetime import datetime
+import base64
+import binascii
+import hashlib
+import time
 from flask_caching import Cache
 import os
+import tempfile
 from pathlib import Path
 from dotenv import load_dotenv
+from db_pool import PoolTimeout
+from storage import create_repository, search_terms
+from task_cache import TaskCache
+from response_cache import encode_json, encoded_response
+from events import ChangeFeed, format_event
+from metrics import Metrics, LATENCY_BUCKETS, ROW_BUCKETS
 
 ENV_PATH = Path(__file__).resolve().parent / ".env"
 load_dotenv(dotenv_path=ENV_PATH, override=True)
@@ -13,8 +23,47 @@ load_dotenv(dotenv_path=ENV_PATH, override=True)
 app = Flask(__name__)
 CORS(app)
 
-# Initialize cache with the app
-cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': 300})  # Cache timeout 5 minutes
+# Initialize cache with the app. The cache is shared by every gunicorn worker:
+# Redis when CACHE_REDIS_URL is set (needs the redis package), otherwise files
+# on local disk. CACHE_TYPE=SimpleCache keeps it in-process for single-worker dev.
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL")
+CACHE_DIR = os.getenv("CACHE_DIR", os.path.join(tempfile.gettempdir(), "task_manager_cache"))
+cache_config = {'CACHE_DEFAULT_TIMEOUT': 300}  # Cache timeout 5 minutes
+if CACHE_REDIS_URL:
+    cache_config.update({'CACHE_TYPE': 'RedisCache', 'CACHE_REDIS_URL': CACHE_REDIS_URL})
+else:
+    cache_config.update({
+        'CACHE_TYPE': os.getenv("CACHE_TYPE", "FileSystemCache"),
+        'CACHE_DIR': CACHE_DIR,
+        'CACHE_THRESHOLD': int(os.getenv("CACHE_THRESHOLD", "2000")),
+    })
+cache = Cache(app, config=cache_config)
+
+# Generation-keyed, single-flight refills on top of the shared cache. File
+# locks live next to (not inside) CACHE_DIR so cache pruning never removes them.
+task_cache = TaskCache(
+    cache,
+    lock_dir=f"{CACHE_DIR}.locks" if cache_config['CACHE_TYPE'] == 'FileSystemCache' else None,
+)
+
+# Prometheus metrics at /metrics. Under gunicorn each worker writes a snapshot
+# to METRICS_DIR (set and cleaned up by gunicorn.conf.py) so any worker can
+# report the whole server; without it the numbers are this process's own.
+metrics = Metrics(directory=os.getenv("METRICS_DIR"))
+metrics.describe("task_http_request_seconds", "histogram", "Request latency by route", LATENCY_BUCKETS)
+metrics.describe("task_db_seconds", "histogram", "Database time by phase (connect, query, fetch)", LATENCY_BUCKETS)
+metrics.describe("task_db_rows", "histogram", "Rows fetched per query", ROW_BUCKETS)
+metrics.describe("task_cache_requests_total", "counter", "Task list cache lookups by key and result (hit, stale, fill)")
+metrics.describe("task_cache_invalidations_total", "counter", "Task cache invalidations")
+metrics.describe("task_db_pool_in_use", "gauge", "Checked out database connections")
+metrics.describe("task_db_pool_idle", "gauge", "Idle database connections")
+metrics.describe("task_db_pool_checkouts_total", "counter", "Database connection checkouts")
+metrics.describe("task_db_pool_timeouts_total", "counter", "Database connection checkout timeouts")
+metrics.describe("task_db_pool_wait_seconds_total", "counter", "Time spent waiting for a database connection")
+metrics.describe("task_sse_subscribers", "gauge", "Open /api/tasks/events streams")
+
+# Requests slower than this are logged with their SQL (0 disables the log)
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "0"))
 
 DB_CONFIG = {
     "host": os.getenv("DB_HOST", "mysql-21f4997e-harisaikumar265-02f5.a.aivencloud.com"),
@@ -26,91 +75,277 @@ DB_CONFIG = {
 
 SSL_CA = os.getenv("DB_SSL_CA")
 
-def _apply_ssl(cfg):
-    if SSL_CA:
-        if not os.path.isfile(SSL_CA):
-            raise RuntimeError(f"DB_SSL_CA file not found: {SSL_CA}")
-        cfg.update({"ssl_ca": SSL_CA, "ssl_verify_cert": True})
-    return cfg
+# TASK_STORE=sqlite runs against a local file instead of MySQL (local
+# development, CI and benchmarks/bench_api.py)
+TASK_STORE = os.getenv("TASK_STORE", "mysql")
+SQLITE_PATH = os.getenv("SQLITE_PATH", str(Path(__file__).resolve().parent / "tasks.db"))
+
+# Deleted task ids are kept this long so clients can sync deletions
+TOMBSTONE_RETENTION_DAYS = int(os.getenv("TOMBSTONE_RETENTION_DAYS", "7"))
+
+# One pool per gunicorn worker; the pool resets itself after a fork
+POOL_OPTIONS = {
+    "size": int(os.getenv("DB_POOL_SIZE", "5")),
+    "max_overflow": int(os.getenv("DB_POOL_MAX_OVERFLOW", "10")),
+    "timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    "recycle": int(os.getenv("DB_POOL_RECYCLE", "3600")),
+}
+
+if TASK_STORE == "sqlite":
+    store_options = {"path": SQLITE_PATH}
+else:
+    store_options = {"config": DB_CONFIG, "ssl_ca": SSL_CA}
+tasks_repo = create_repository(
+    TASK_STORE,
+    tombstone_retention_days=TOMBSTONE_RETENTION_DAYS,
+    metrics=metrics,
+    **store_options,
+    **POOL_OPTIONS,
+)
+
+def pool_gauges():
+    stats = tasks_repo.pool.stats()
+    return [
+        ("task_db_pool_in_use", (), stats['in_use']),
+        ("task_db_pool_idle", (), stats['idle']),
+    ]
 
-def get_db_connection():
-    cfg = _apply_ssl(DB_CONFIG.copy())
-    return mysql.connector.connect(**cfg)
+def pool_counters():
+    stats = tasks_repo.pool.stats()
+    return [
+        ("task_db_pool_checkouts_total", (), stats['checkouts']),
+        ("task_db_pool_timeouts_total", (), stats['timeouts']),
+        ("task_db_pool_wait_seconds_total", (), stats['wait_time_total']),
+    ]
+
+metrics.add_gauges(pool_gauges)
+metrics.add_counters(pool_counters)
 
 def init_db():
     """Initialize the database and create tables"""
     try:
-        cfg = DB_CONFIG.copy()
-        cfg.pop("database", None)
-        cfg = _apply_ssl(cfg)
-        print(f"Initializing DB connection to {cfg['host']}:{cfg['port']}")
-        connection = mysql.connector.connect(**cfg)
-        cursor = connection.cursor()
-        
-        # Create database if it doesn't exist
-        cursor.execute("CREATE DATABASE IF NOT EXISTS todo_app")
-        cursor.execute("USE todo_app")
-        
-        # Create tasks table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS tasks (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                title VARCHAR(255) NOT NULL,
-                description TEXT,
-                completed BOOLEAN DEFAULT FALSE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-            )
-        """)
-        
-        connection.commit()
-        cursor.close()
-        connection.close()
+        tasks_repo.init_schema()
         print("Database initialized successfully!")
         
     except RuntimeError as e:
         print(f"Error initializing database: {e}")
-    except mysql.connector.Error as e:
+    except tasks_repo.Error as e:
         print(f"Error initializing database: {e}")
 
+@app.errorhandler(PoolTimeout)
+def handle_pool_timeout(e):
+    return jsonify({'error': 'Database busy, try again'}), 503
+
+@app.before_request
+def start_timer():
+    g.started = time.perf_counter()
+    g.trace = metrics.start_trace() if SLOW_REQUEST_MS else None
+
+@app.after_request
+def record_request(response):
+    elapsed = time.perf_counter() - g.started
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    metrics.observe(
+        "task_http_request_seconds", elapsed,
+        (('route', route), ('method', request.method), ('status', str(response.status_code)))
+    )
+    if g.trace is not None:
+        statements = metrics.stop_trace(g.trace)
+        if elapsed * 1000 >= SLOW_REQUEST_MS:
+            sql = "".join(f"\n  {seconds * 1000:.1f}ms {statement}" for statement, seconds in statements)
+            app.logger.warning("Slow request %s %s %.1fms%s", request.method, request.full_path.rstrip('?'),
+                               elapsed * 1000, sql)
+    return response
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/')
 def index():
     return render_template('index.html')
 
+@app.route('/api/db/pool', methods=['GET'])
+def pool_stats():
+    return jsonify(tasks_repo.pool.stats())
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+def encode_cursor(task):
+    """Opaque keyset cursor pointing just past `task`"""
+    raw = f"{task['updated_at'].isoformat()}|{task['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor_token):
+    """Inverse of encode_cursor, returns (updated_at, id) or raises ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor_token.encode()).decode()
+        updated_at, task_id = raw.split("|")
+        return datetime.fromisoformat(updated_at), int(task_id)
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(str(e))
+
+def parse_list_args():
+    """(filter_type, limit, error) from the query string shared by list and search"""
+    filter_type = request.args.get('filter', 'all')
+    if filter_type not in ('completed', 'pending'):
+        filter_type = 'all'  # unknown filters list everything; one cache key for all of them
+
+    try:
+        limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        return filter_type, None, 'limit must be an integer'
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        return filter_type, None, f'limit must be between 1 and {MAX_PAGE_SIZE}'
+    return filter_type, limit, None
+
 @app.route('/api/tasks', methods=['GET'])
 def get_tasks():
-    filter_type = request.args.get('filter', 'all')
-    cache_key = f"tasks_{filter_type}"
-    cached_tasks = cache.get(cache_key)
-    if cached_tasks:
-        print("Serving tasks from cache.")   # <-- THIS LINE
-        return jsonify(cached_tasks)
-    # Otherwise, fetch from db and cache
-    print("Serving tasks from database and caching result.")
-
-    connection = get_db_connection()
-    cursor = connection.cursor(dictionary=True)
-
-    if filter_type == 'completed':
-        cursor.execute("SELECT * FROM tasks WHERE completed = TRUE ORDER BY updated_at DESC")
-    elif filter_type == 'pending':
-        cursor.execute("SELECT * FROM tasks WHERE completed = FALSE ORDER BY updated_at DESC")
+    filter_type, limit, error = parse_list_args()
+    if error:
+        return jsonify({'error': error}), 400
+    cursor_token = request.args.get('cursor')
+
+    after = None
+    if cursor_token:
+        try:
+            after = decode_cursor(cursor_token)
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+
+    # Only the default first page is cached; deeper pages are cheap index range scans
+    cacheable = after is None and limit == DEFAULT_PAGE_SIZE
+    def load_page():
+        tasks, has_more, version = tasks_repo.list_page(filter_type, limit, after)
+        next_cursor = encode_cursor(tasks[-1]) if has_more else None
+        page = {'tasks': tasks, 'next_cursor': next_cursor, 'sync_token': str(version)}
+        # The cache holds the encoded (and pre-compressed) body, so a hit skips JSON encoding
+        return {'body': encode_json(page), 'version': version}
+
+    if cacheable:
+        cache_key = f"tasks_{filter_type}_page"
+        entry, source = task_cache.get_or_fill(cache_key, load_page)
+        metrics.inc("task_cache_requests_total", (('key', cache_key), ('result', source)))
     else:
-        cursor.execute("SELECT * FROM tasks ORDER BY updated_at DESC")
+        entry = load_page()
+
+    return conditional_response(entry)
+
+MAX_QUERY_LENGTH = 200
+# Search pages by offset, so results stop this deep; refine the query instead
+MAX_SEARCH_RESULTS = 1000
+
+@app.route('/api/tasks/search', methods=['GET'])
+def search_tasks():
+    """Ranked full-text search over title and description.
+
+    Every word of `q` must match as a word prefix. Combines with `filter`
+    and pages like /api/tasks; `next_cursor` is opaque to the client.
+    `truncated` is true when only the newest matches were ranked, so older
+    ones can be missing until the query is refined.
+    """
+    terms = search_terms(request.args.get('q', '')[:MAX_QUERY_LENGTH])
+    if not terms:
+        return jsonify({'error': 'q is required'}), 400
+    filter_type, limit, error = parse_list_args()
+    if error:
+        return jsonify({'error': error}), 400
 
-    tasks = cursor.fetchall()
-    cursor.close()
-    connection.close()
+    try:
+        offset = int(request.args.get('cursor') or 0)
+    except ValueError:
+        return jsonify({'error': 'Invalid cursor'}), 400
+    if not 0 <= offset < MAX_SEARCH_RESULTS:
+        return jsonify({'error': 'Invalid cursor'}), 400
+
+    def load_results():
+        tasks, has_more, truncated, version = tasks_repo.search(terms, filter_type, limit, offset)
+        next_offset = offset + limit
+        next_cursor = str(next_offset) if has_more and next_offset < MAX_SEARCH_RESULTS else None
+        page = {'tasks': tasks, 'next_cursor': next_cursor, 'truncated': truncated,
+                'sync_token': str(version)}
+        return {'body': encode_json(page), 'version': version}
+
+    if limit == DEFAULT_PAGE_SIZE:
+        # Keyed by the normalized query and dropped with the lists on every write
+        digest = hashlib.sha1(" ".join(terms).encode()).hexdigest()
+        entry, source = task_cache.get_or_fill(
+            f"search_{filter_type}_{offset}_{digest}", load_results, keep_stale=False
+        )
+        metrics.inc("task_cache_requests_total", (('key', 'search'), ('result', source)))
+    else:
+        entry = load_results()
 
-    cache.set(cache_key, tasks)
+    return conditional_response(entry)
 
-    return jsonify(tasks)
+def conditional_response(entry):
+    """Encoded response tagged with the table version, or 304 if the client has it"""
+    response = encoded_response(entry['body'])
+    # No Last-Modified: task_clock keeps whole seconds, so two writes in the
+    # same second would share one and If-Modified-Since would answer 304 stale
+    response.set_etag(f"v{entry['version']}", weak=True)
+    response.cache_control.no_cache = True  # always revalidate, 304 keeps it cheap
+    return response.make_conditional(request)
+
+MAX_CHANGES = 1000
+
+def load_changes(since):
+    """Delta since a sync token, returns (delta, error); on error the client should reload"""
+    return tasks_repo.changes(since, MAX_CHANGES)
+
+@app.route('/api/tasks/changes', methods=['GET'])
+def get_task_changes():
+    try:
+        since = int(request.args.get('since', ''))
+    except ValueError:
+        return jsonify({'error': 'since must be a sync token'}), 400
+
+    delta, error = load_changes(since)
+    if error:
+        return jsonify({'error': error}), 410
+    return jsonify(delta)
+
+# Pushes deltas to /api/tasks/events subscribers. Serve with an evented
+# worker (see gunicorn.conf.py) so idle streams do not pin a worker each.
+change_feed = ChangeFeed(
+    task_cache.generation,
+    lambda since: load_changes(since)[0],
+    lambda: tasks_repo.version()[0],
+    poll_interval=float(os.getenv("SSE_POLL_INTERVAL", "1")),
+    dumps=app.json.dumps,
+)
+metrics.add_gauges(lambda: [("task_sse_subscribers", (), change_feed.stats()['subscribers'])])
+SSE_HEARTBEAT = 15
+
+@app.route('/api/tasks/events', methods=['GET'])
+def task_events():
+    """Server-Sent Events stream of task changes"""
+    def stream():
+        subscription = change_feed.subscribe()
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                if subscription.overflowed:
+                    yield format_event('resync', {})
+                    return
+                message = subscription.get(timeout=SSE_HEARTBEAT)
+                yield message if message is not None else ": keep-alive\n\n"
+        finally:
+            change_feed.unsubscribe(subscription)
+
+    response = Response(stream(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # stop proxies from buffering the stream
+    return response
 
 def clear_cache():
-    """Clear all cache related to tasks"""
-    cache.delete("tasks_all")
-    cache.delete("tasks_completed")
-    cache.delete("tasks_pending")
+    """Invalidate all cached task lists in every worker and push the change"""
+    task_cache.invalidate()
+    metrics.inc("task_cache_invalidations_total")
+    change_feed.notify()
+
+UPDATABLE_FIELDS = ('title', 'description', 'completed')
 
 @app.route('/api/tasks', methods=['POST'])
 def create_task():
@@ -121,18 +356,7 @@ def create_task():
     if not title:
         return jsonify({'error': 'Title is required'}), 400
     
-    connection = get_db_connection()
-    cursor = connection.cursor()
-    
-    cursor.execute(
-        "INSERT INTO tasks (title, description) VALUES (%s, %s)",
-        (title, description)
-    )
-    connection.commit()
-    
-    task_id = cursor.lastrowid
-    cursor.close()
-    connection.close()
+    task_id = tasks_repo.create(title, description)
     clear_cache()  # Invalidate cache after data change
     
     return jsonify({'id': task_id, 'message': 'Task created successfully'}), 201
@@ -141,62 +365,127 @@ def create_task():
 def update_task(task_id):
     data = request.get_json()
     
-    connection = get_db_connection()
-    cursor = connection.cursor()
-    
-    # Build dynamic update query
-    update_fields = []
-    values = []
-    
-    if 'title' in data:
-        update_fields.append("title = %s")
-        values.append(data['title'])
-    
-    if 'description' in data:
-        update_fields.append("description = %s")
-        values.append(data['description'])
+    fields = {name: data[name] for name in UPDATABLE_FIELDS if name in data}
     
-    if 'completed' in data:
-        update_fields.append("completed = %s")
-        values.append(data['completed'])
-    
-    if not update_fields:
+    if not fields:
         return jsonify({'error': 'No fields to update'}), 400
     
-    values.append(task_id)
-    query = f"UPDATE tasks SET {', '.join(update_fields)} WHERE id = %s"
-    
-    cursor.execute(query, values)
-    connection.commit()
-    
-    if cursor.rowcount == 0:
-        cursor.close()
-        connection.close()
+    if not tasks_repo.update(task_id, fields):
         return jsonify({'error': 'Task not found'}), 404
     
-    cursor.close()
-    connection.close()
     clear_cache()  # Invalidate cache after data change    
     return jsonify({'message': 'Task updated successfully'})
 
 @app.route('/api/tasks/<int:task_id>', methods=['DELETE'])
 def delete_task(task_id):
-    connection = get_db_connection()
-    cursor = connection.cursor()
-    
-    cursor.execute("DELETE FROM tasks WHERE id = %s", (task_id,))
-    connection.commit()
-    
-    if cursor.rowcount == 0:
-        cursor.close()
-        connection.close()
+    if not tasks_repo.delete(task_id):
         return jsonify({'error': 'Task not found'}), 404
     
-    cursor.close()
-    connection.close()
     clear_cache()  # Invalidate cache after data change
     return jsonify({'message': 'Task deleted successfully'})
 
+MAX_BATCH_SIZE = 10000
+
+def parse_batch_operation(raw):
+    """Validate one batch item, returns (operation, error)"""
+    if not isinstance(raw, dict):
+        return None, 'Operation must be an object'
+    op = raw.get('op')
+
+    if op == 'create':
+        title = raw.get('title')
+        if not title or not isinstance(title, str):
+            return None, 'Title is required'
+        if len(title) > 255:
+            return None, 'Title is too long'
+        return {'op': op, 'title': title, 'description': raw.get('description', '')}, None
+
+    if op in ('update', 'delete'):
+        task_id = raw.get('id')
+        if not isinstance(task_id, int) or isinstance(task_id, bool):
+            return None, 'id must be an integer'
+        if op == 'delete':
+            return {'op': op, 'id': task_id}, None
+        fields = {name: raw[name] for name in UPDATABLE_FIELDS if name in raw}
+        if not fields:
+            return None, 'No fields to update'
+        if 'title' in fields and not fields['title']:
+            return None, 'Title is required'
+        if 'completed' in fields and not isinstance(fields['completed'], bool):
+            return None, 'completed must be a boolean'
+        return {'op': op, 'id': task_id, 'fields': fields}, None
+
+    return None, f"Unknown op: {op!r}"
+
+def rolled_back(results):
+    """Per-item results of an atomic batch that was not applied"""
+    return [
+        result if result and result['status'] >= 400
+        else {'index': index, 'status': 424, 'error': 'Not applied: batch rolled back'}
+        for index, result in enumerate(results)
+    ]
+
+@app.route('/api/tasks/batch', methods=['POST'])
+def batch_tasks():
+    """Apply many create/update/delete operations in a single transaction.
+
+    Operations are applied grouped by type (creates, then updates, then
+    deletes). With mode "atomic" (default) any failing item rolls back the
+    whole batch and every other item is reported as 424; with "best_effort"
+    failing items are reported and skipped.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Body must be a JSON object'}), 400
+    raw_operations = data.get('operations')
+    mode = data.get('mode', 'atomic')
+
+    if mode not in ('atomic', 'best_effort'):
+        return jsonify({'error': 'mode must be "atomic" or "best_effort"'}), 400
+    if not isinstance(raw_operations, list) or not raw_operations:
+        return jsonify({'error': 'operations must be a non-empty list'}), 400
+    if len(raw_operations) > MAX_BATCH_SIZE:
+        return jsonify({'error': f'At most {MAX_BATCH_SIZE} operations per batch'}), 400
+
+    best_effort = mode == 'best_effort'
+    results = [None] * len(raw_operations)
+    grouped = {'create': [], 'update': [], 'delete': []}
+    for index, raw in enumerate(raw_operations):
+        operation, error = parse_batch_operation(raw)
+        if error:
+            results[index] = {'index': index, 'status': 400, 'error': error}
+        else:
+            grouped[operation['op']].append((index, operation))
+
+    if any(results) and not best_effort:
+        return jsonify({'committed': False, 'results': rolled_back(results)}), 400
+
+    committed, error = tasks_repo.apply_batch(grouped, results, best_effort)
+    if not committed:
+        body = {'committed': False, 'results': rolled_back(results)}
+        if error:
+            body['error'] = error
+        return jsonify(body), 400
+
+    clear_cache()  # Invalidate cache once for the whole batch
+    return jsonify({'committed': True, 'results': results})
+
+@app.route('/api/tasks/complete-all', methods=['POST'])
+def complete_all_tasks():
+    updated = tasks_repo.complete_all()
+
+    if updated:
+        clear_cache()  # Invalidate cache after data change
+    return jsonify({'updated': updated, 'message': f'{updated} task(s) completed'})
+
+@app.route('/api/tasks/completed', methods=['DELETE'])
+def delete_completed_tasks():
+    deleted = tasks_repo.delete_completed()
+
+    if deleted:
+        clear_cache()  # Invalidate cache after data change
+    return jsonify({'deleted': deleted, 'message': f'{deleted} completed task(s) deleted'})
+
 if __name__ == '__main__':
     init_db()
     app.run(debug=True)
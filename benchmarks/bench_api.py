@@ -0,0 +1,230 @@
+"""API benchmark: seed an SQLite store, drive the endpoints, report latency percentiles.
+
+Runs gunicorn against a fresh SQLite database (TASK_STORE=sqlite) seeded
+with --tasks rows, then runs each scenario for --duration seconds with
+--concurrency keep-alive clients and prints p50/p95/p99 latency and
+throughput per scenario. Run from the repository root:
+
+    python benchmarks/bench_api.py --tasks 100000 --concurrency 16 --duration 10
+    python benchmarks/bench_api.py --tasks 1000000 --json results.json
+
+The load generator is a thread pool in one process, so very fast endpoints
+can be client-bound; compare runs on the same machine only.
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEED_CHUNK = 10_000
+
+
+def configure_env(workdir):
+    env = {
+        "TASK_STORE": "sqlite",
+        "SQLITE_PATH": os.path.join(workdir, "tasks.db"),
+        "CACHE_DIR": os.path.join(workdir, "cache"),
+    }
+    os.environ.update(env)
+    return env
+
+
+def seed(tasks_repo, count):
+    """Bulk insert `count` tasks spread over the last year"""
+    now = datetime.now().replace(microsecond=0)
+    rng = random.Random(42)
+    with tasks_repo.pool.connection() as connection:
+        connection.execute("BEGIN IMMEDIATE")
+        for start in range(0, count, SEED_CHUNK):
+            rows = []
+            for i in range(start, min(count, start + SEED_CHUNK)):
+                created = now - timedelta(seconds=rng.randrange(365 * 86400))
+                rows.append((
+                    f"Task {i}", f"Seeded task number {i}", rng.random() < 0.4,
+                    created, created + timedelta(seconds=rng.randrange(86400)),
+                ))
+            connection.executemany(
+                "INSERT INTO tasks (title, description, completed, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+        connection.commit()
+        connection.execute("ANALYZE")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(env, port, workers, worker_class):
+    command = [
+        sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py",
+        "-w", str(workers), "-b", f"127.0.0.1:{port}", "app:app",
+    ]
+    if worker_class:
+        command += ["-k", worker_class]
+    server = subprocess.Popen(command, cwd=ROOT, env={**os.environ, **env},
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            request("127.0.0.1", port, "GET", "/api/db/pool")
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("server did not start")
+
+
+def request(host, port, method, path, body=None, connection=None, accept_encoding="gzip"):
+    connection = connection or http.client.HTTPConnection(host, port, timeout=30)
+    headers = {"Accept-Encoding": accept_encoding}
+    if body is not None:
+        body = json.dumps(body)
+        headers["Content-Type"] = "application/json"
+    connection.request(method, path, body=body, headers=headers)
+    response = connection.getresponse()
+    data = response.read()
+    return response.status, data
+
+
+def build_scenarios(host, port, max_id):
+    """(name, make_request) pairs; make_request(rng) -> (method, path, body)"""
+    _, first = request(host, port, "GET", "/api/tasks?limit=200", accept_encoding="identity")
+    page = json.loads(first)
+    second_cursor = page["next_cursor"] or ""
+    sync_token = page["sync_token"]
+
+    scenarios = []
+    for filter_type in ("all", "completed", "pending"):
+        scenarios.append((
+            f"GET list filter={filter_type}",
+            lambda rng, f=filter_type: ("GET", f"/api/tasks?filter={f}", None),
+        ))
+    for filter_type in ("all", "pending"):
+        scenarios.append((
+            f"GET page 2 filter={filter_type}",
+            lambda rng, f=filter_type: ("GET", f"/api/tasks?filter={f}&limit=200&cursor={second_cursor}", None),
+        ))
+    scenarios += [
+        ("GET search selective", lambda rng: ("GET", f"/api/tasks/search?q={rng.randrange(1000, 10000)}", None)),
+        ("GET search cached", lambda rng: ("GET", "/api/tasks/search?q=task+99", None)),
+        ("GET changes", lambda rng: ("GET", f"/api/tasks/changes?since={sync_token}", None)),
+        ("POST create", lambda rng: ("POST", "/api/tasks", {"title": "bench", "description": "created"})),
+        ("PUT toggle", lambda rng: ("PUT", f"/api/tasks/{rng.randint(1, max_id)}",
+                                    {"completed": rng.random() < 0.5})),
+        ("mixed 90% list / 10% toggle", lambda rng: (
+            ("GET", "/api/tasks?filter=all", None) if rng.random() < 0.9 else
+            ("PUT", f"/api/tasks/{rng.randint(1, max_id)}", {"completed": rng.random() < 0.5})
+        )),
+    ]
+    return scenarios
+
+
+def run_scenario(host, port, make_request, concurrency, duration):
+    latencies, errors = [], []
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def client(seed_value):
+        rng = random.Random(seed_value)
+        connection = http.client.HTTPConnection(host, port, timeout=30)
+        local_latencies, local_errors = [], 0
+        while time.monotonic() < deadline:
+            method, path, body = make_request(rng)
+            started = time.perf_counter()
+            try:
+                status, _ = request(host, port, method, path, body, connection)
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                connection = http.client.HTTPConnection(host, port, timeout=30)
+                status = None
+            local_latencies.append(time.perf_counter() - started)
+            if status is None or status >= 500:
+                local_errors += 1
+        connection.close()
+        with lock:
+            latencies.extend(local_latencies)
+            errors.append(local_errors)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+
+    latencies.sort()
+
+    def pct(value):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * value / 100))] * 1e3 if latencies else 0.0
+
+    return {
+        "requests": len(latencies),
+        "errors": sum(errors),
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": pct(50),
+        "p95_ms": pct(95),
+        "p99_ms": pct(99),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10_000, help="rows to seed (10k-1M)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per scenario")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--worker-class", help="gunicorn worker class (default from gunicorn.conf.py)")
+    parser.add_argument("--only", help="run scenarios whose name contains this text")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="task_bench_") as workdir:
+        env = configure_env(workdir)
+        sys.path.insert(0, ROOT)
+        import app  # noqa: E402  (reads the env configured above)
+
+        app.init_db()
+        started = time.perf_counter()
+        seed(app.tasks_repo, args.tasks)
+        print(f"Seeded {args.tasks} tasks in {time.perf_counter() - started:.1f}s")
+        app.tasks_repo.pool.dispose()
+
+        port = free_port()
+        server = start_server(env, port, args.workers, args.worker_class)
+        try:
+            results = {}
+            print(f"{'scenario':<32} {'requests':>9} {'errors':>7} {'req/s':>9} "
+                  f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+            for name, make_request in build_scenarios("127.0.0.1", port, args.tasks):
+                if args.only and args.only not in name:
+                    continue
+                result = run_scenario("127.0.0.1", port, make_request, args.concurrency, args.duration)
+                results[name] = result
+                print(f"{name:<32} {result['requests']:>9} {result['errors']:>7} "
+                      f"{result['throughput']:>9.1f} {result['p50_ms']:>8.2f} "
+                      f"{result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f}")
+        finally:
+            server.terminate()
+            server.wait()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
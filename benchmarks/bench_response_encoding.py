@@ -0,0 +1,116 @@
+"""Micro-benchmark: cost per cache hit of re-encoding vs serving pre-encoded bytes.
+
+Each hit goes through TaskCache.get_or_fill on a real cache backend, so it
+includes reading and unpickling the entry: caching the task list and
+encoding it per request ("jsonify/hit") against caching the encoded
+variants ("pre-encoded/hit"). Run from the repository root:
+
+    python benchmarks/bench_response_encoding.py [--repeat N] [--cache-type FileSystemCache]
+    python benchmarks/bench_response_encoding.py --cache-type RedisCache --redis-url redis://localhost:6379/0
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask, jsonify  # noqa: E402
+from flask_caching import Cache  # noqa: E402
+
+from response_cache import encode_json, encoded_response  # noqa: E402
+from task_cache import TaskCache  # noqa: E402
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+def make_page(count):
+    now = datetime(2025, 1, 1)
+    tasks = [
+        {
+            "id": count - i,
+            "title": f"Task number {i}",
+            "description": "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+            "completed": i % 3 == 0,
+            "created_at": now - timedelta(minutes=i),
+            "updated_at": now - timedelta(seconds=i),
+        }
+        for i in range(count)
+    ]
+    return {"tasks": tasks, "next_cursor": None}
+
+
+def per_call(fn, repeat):
+    fn()  # warm up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat
+
+
+def make_task_cache(app, args, workdir):
+    """TaskCache on the backend app.py would use, with a throwaway directory"""
+    config = {"CACHE_DEFAULT_TIMEOUT": 300, "CACHE_TYPE": args.cache_type}
+    lock_dir = None
+    if args.cache_type == "RedisCache":
+        config["CACHE_REDIS_URL"] = args.redis_url
+    elif args.cache_type == "FileSystemCache":
+        config["CACHE_DIR"] = os.path.join(workdir, "cache")
+        lock_dir = os.path.join(workdir, "locks")
+    return TaskCache(Cache(app, config=config), lock_dir=lock_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--cache-type", default="FileSystemCache",
+                        help="FileSystemCache (the default in app.py), SimpleCache or RedisCache")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/0")
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    headers = {"Accept-Encoding": "gzip, deflate, br"}
+
+    print(f"Cache backend: {args.cache_type}")
+    print(f"{'tasks':>8} {'jsonify/hit':>12} {'pre-encoded/hit':>16} {'speedup':>8} "
+          f"{'identity':>10} {'gzip':>10} {'fill once':>10}")
+    with tempfile.TemporaryDirectory(prefix="bench_encoding_") as workdir:
+        task_cache = make_task_cache(app, args, workdir)
+        for count in SIZES:
+            run_size(app, task_cache, headers, count, args.repeat)
+
+
+def run_size(app, task_cache, headers, count, repeat):
+    page = make_page(count)
+    repeat = max(1, repeat * 1_000 // count)
+    with app.test_request_context(headers=headers):
+        started = time.perf_counter()
+        variants = encode_json(page)
+        fill = time.perf_counter() - started
+
+        # Fill both entries, then time hits only
+        task_cache.get_or_fill(f"raw_{count}", lambda: page)
+        task_cache.get_or_fill(f"encoded_{count}", lambda: variants)
+
+        def raw_hit():
+            value, source = task_cache.get_or_fill(f"raw_{count}", lambda: page)
+            assert source == "hit"
+            return jsonify(value).get_data()
+
+        def encoded_hit():
+            value, source = task_cache.get_or_fill(f"encoded_{count}", lambda: variants)
+            assert source == "hit"
+            return encoded_response(value).get_data()
+
+        before = per_call(raw_hit, repeat)
+        after = per_call(encoded_hit, repeat)
+
+    print(f"{count:>8} {before * 1e3:>10.3f}ms {after * 1e3:>14.4f}ms {before / after:>7.0f}x "
+          f"{len(variants['identity']) / 1024:>8.0f}KB {len(variants['gzip']) / 1024:>8.0f}KB "
+          f"{fill * 1e3:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
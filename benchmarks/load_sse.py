@@ -0,0 +1,106 @@
+"""Load test: N concurrent /api/tasks/events subscribers on one server process.
+
+Opens N idle SSE connections, creates a task through the API and measures
+how long each subscriber takes to receive the change. Start the server with
+an evented worker first, e.g.
+
+    gunicorn -c gunicorn.conf.py -w 1 app:app
+    python benchmarks/load_sse.py --url http://127.0.0.1:8000 --subscribers 2000
+
+Raise the open file limit (ulimit -n) above the subscriber count on both sides
+and keep the count below the worker's worker_connections, which must leave
+room for the POST that triggers the event.
+"""
+import argparse
+import asyncio
+import json
+import time
+import urllib.request
+from urllib.parse import urlsplit
+
+
+async def subscribe(host, port, ready, fired, latencies, failures):
+    connected = False
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(
+            f"GET /api/tasks/events HTTP/1.1\r\nHost: {host}\r\n"
+            "Accept: text/event-stream\r\n\r\n".encode()
+        )
+        await writer.drain()
+        status = await reader.readline()
+        if b" 200 " not in status:
+            raise RuntimeError(status.decode().strip())
+        connected = True
+        ready.release()
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise RuntimeError("stream closed")
+            if b"event: changes" in line:
+                latencies.append(time.perf_counter() - fired[0])
+                break
+        writer.close()
+    except Exception as e:
+        failures.append(str(e))
+        if not connected:
+            ready.release()
+
+
+def create_task(url):
+    request = urllib.request.Request(
+        f"{url}/api/tasks",
+        data=json.dumps({"title": "load test", "description": "sse fan-out"}).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return json.load(response)
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--subscribers", type=int, default=1000)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    parts = urlsplit(args.url)
+    ready = asyncio.Semaphore(0)
+    fired = [0.0]
+    latencies, failures = [], []
+
+    started = time.perf_counter()
+    tasks = [
+        asyncio.create_task(subscribe(parts.hostname, parts.port or 80, ready, fired, latencies, failures))
+        for _ in range(args.subscribers)
+    ]
+    for _ in range(args.subscribers):
+        await ready.acquire()
+    connected = args.subscribers - len(failures)
+    print(f"{connected} subscribers connected in {time.perf_counter() - started:.2f}s")
+
+    # Let the server's feed take its baseline version before the write
+    await asyncio.sleep(1.0)
+    fired[0] = time.perf_counter()
+    await asyncio.get_running_loop().run_in_executor(None, create_task, args.url)
+
+    done, pending = await asyncio.wait(tasks, timeout=args.timeout)
+    for task in pending:
+        task.cancel()
+
+    print(f"received: {len(latencies)}/{connected}  failures: {len(failures)}  timed out: {len(pending)}")
+    if failures:
+        print(f"first failure: {failures[0]}")
+    if latencies:
+        print("fan-out latency  p50 {:.1f}ms  p95 {:.1f}ms  p99 {:.1f}ms  max {:.1f}ms".format(
+            *(percentile(latencies, pct) * 1e3 for pct in (50, 95, 99)), max(latencies) * 1e3))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,172 @@
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection could be checked out in time"""
+
+
+class _PooledConnection:
+    __slots__ = ("conn", "created_at", "pid")
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.pid = os.getpid()
+
+
+class ConnectionPool:
+    """A small thread-safe connection pool.
+
+    Keeps up to ``size`` idle connections and allows ``max_overflow`` extra
+    connections under load. Connections are validated with ``ping`` on
+    checkout and replaced once older than ``recycle`` seconds. The pool is
+    reset in a forked child so gunicorn workers never share sockets.
+    """
+
+    def __init__(self, creator, size=5, max_overflow=10, timeout=30.0,
+                 recycle=3600, ping=None):
+        self._creator = creator
+        self._ping = ping
+        self.size = size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.recycle = recycle
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._cond = threading.Condition()
+        self._idle = deque()
+        self._in_use = 0
+        self._checkouts = 0
+        self._created = 0
+        self._recycled = 0
+        self._invalidated = 0
+        self._timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _check_pid(self):
+        # Connections inherited from the parent share its sockets, so they
+        # are dropped without being closed.
+        if self._pid != os.getpid():
+            self._reset()
+
+    def _usable(self, record):
+        if self.recycle is not None and time.monotonic() - record.created_at > self.recycle:
+            self._recycled += 1
+            return False
+        if self._ping is not None:
+            try:
+                self._ping(record.conn)
+            except Exception:
+                self._invalidated += 1
+                return False
+        return True
+
+    def _checkout(self):
+        self._check_pid()
+        started = time.monotonic()
+        deadline = started + self.timeout
+        record = None
+        with self._cond:
+            while True:
+                if self._idle:
+                    record = self._idle.pop()
+                    break
+                if self._in_use < self.size + self.max_overflow:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeout(
+                        f"No connection available within {self.timeout}s "
+                        f"(size={self.size}, overflow={self.max_overflow})"
+                    )
+                self._cond.wait(remaining)
+            self._in_use += 1
+            self._checkouts += 1
+            waited = time.monotonic() - started
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+
+        try:
+            if record is not None and not self._usable(record):
+                _close_quietly(record.conn)
+                record = None
+            if record is None:
+                record = _PooledConnection(self._creator())
+                self._created += 1
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+        return record
+
+    def _checkin(self, record):
+        if record.pid != os.getpid():
+            return
+        discard = False
+        try:
+            # End any transaction left open so the next borrower does not
+            # see a stale snapshot or inherit uncommitted writes.
+            if getattr(record.conn, "in_transaction", True):
+                record.conn.rollback()
+        except Exception:
+            discard = True
+            self._invalidated += 1
+        with self._cond:
+            self._in_use -= 1
+            if not discard and len(self._idle) < self.size:
+                self._idle.append(record)
+                record = None
+            self._cond.notify()
+        if record is not None:
+            _close_quietly(record.conn)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection, returning it to the pool on exit"""
+        record = self._checkout()
+        try:
+            yield record.conn
+        finally:
+            self._checkin(record)
+
+    def dispose(self):
+        """Close every idle connection"""
+        self._check_pid()
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+        for record in idle:
+            _close_quietly(record.conn)
+
+    def stats(self):
+        self._check_pid()
+        with self._cond:
+            return {
+                "size": self.size,
+                "max_overflow": self.max_overflow,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "checkouts": self._checkouts,
+                "created": self._created,
+                "recycled": self._recycled,
+                "invalidated": self._invalidated,
+                "timeouts": self._timeouts,
+                "wait_time_total": round(self._wait_total, 6),
+                "wait_time_max": round(self._wait_max, 6),
+            }
+
+
+def _close_quietly(conn):
+    try:
+        conn.close()
+    except Exception:
+        pass
@@ -0,0 +1,111 @@
+import json
+import queue
+import threading
+
+
+class Subscription:
+    __slots__ = ("queue", "overflowed")
+
+    def __init__(self, max_queue):
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.overflowed = False
+
+    def get(self, timeout):
+        """Next encoded event, or None when nothing arrived within timeout"""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class ChangeFeed:
+    """Fans task changes out to the Server-Sent Events subscribers of a worker.
+
+    A single background thread per worker watches ``get_generation`` (the
+    shared cache generation, bumped by every write in any worker) and, when
+    it moves, loads one delta with ``load_changes(since)`` and queues the
+    same pre-encoded message for every subscriber. Writes in this worker
+    call ``notify`` to skip the wait. Under gevent the thread and queues are
+    cooperative, so idle subscribers cost a greenlet each, not a worker.
+    """
+
+    def __init__(self, get_generation, load_changes, get_version,
+                 poll_interval=1.0, max_queue=100, dumps=json.dumps):
+        self._get_generation = get_generation
+        self._dumps = dumps
+        self._load_changes = load_changes
+        self._get_version = get_version
+        self.poll_interval = poll_interval
+        self.max_queue = max_queue
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._published = 0
+
+    def subscribe(self):
+        subscription = Subscription(self.max_queue)
+        with self._lock:
+            self._subscribers.add(subscription)
+            if self._thread is None or not self._thread.is_alive():
+                # Started lazily so it runs in the worker, never the gunicorn master
+                self._thread = threading.Thread(target=self._run, name="change-feed", daemon=True)
+                self._thread.start()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def notify(self):
+        """Wake the feed now instead of at the next poll"""
+        self._wakeup.set()
+
+    def stats(self):
+        with self._lock:
+            return {"subscribers": len(self._subscribers), "published": self._published}
+
+    def publish(self, event, payload):
+        message = format_event(event, payload, self._dumps)
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            try:
+                subscription.queue.put_nowait(message)
+            except queue.Full:
+                # Too slow to keep up; the stream tells the client to resync
+                subscription.overflowed = True
+        self._published += 1
+
+    def _run(self):
+        generation = None
+        version = None
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    self._thread = None
+                    return
+            try:
+                current = self._get_generation()
+                if version is None:
+                    version = self._get_version()
+                    generation = current
+                elif current != generation:
+                    generation = current
+                    delta = self._load_changes(version)
+                    if delta is None:
+                        version = self._get_version()
+                        self.publish("resync", {"sync_token": str(version)})
+                    elif delta["changed"] or delta["deleted"]:
+                        delta["since"] = str(version)
+                        version = int(delta["sync_token"])
+                        self.publish("changes", delta)
+            except Exception as e:
+                print(f"Change feed error: {e}")
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+
+def format_event(event, payload, dumps=json.dumps):
+    data = dumps(payload, separators=(",", ":"))
+    return f"event: {event}\ndata: {data}\n\n"
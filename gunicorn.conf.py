@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+from metrics import reset_directory, retire_worker
+
+# /api/tasks/events keeps one long-lived response per open tab. An evented
+# worker serves those as greenlets instead of tying up a sync worker each.
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gevent")
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "5000"))
+
+# Per-worker metrics snapshots, merged by /metrics. Workers inherit the
+# variable; give each server on a host its own directory.
+metrics_dir = os.environ.setdefault("METRICS_DIR", os.path.join(tempfile.gettempdir(), "task_manager_metrics"))
+
+
+def on_starting(server):
+    reset_directory(metrics_dir)
+    # Create or migrate the schema and prune tombstones before any worker
+    # serves. It runs in a child process so the master never imports the app
+    # (its locks would be created before gevent patches the workers).
+    subprocess.run([sys.executable, "-c", "import app; app.init_db()"],
+                   cwd=os.path.dirname(os.path.abspath(__file__)), check=False)
+
+
+def worker_exit(server, worker):
+    # Runs in the exiting worker: write its final numbers for child_exit
+    app = sys.modules.get("app")
+    if app is not None:
+        app.metrics.flush()
+
+
+def child_exit(server, worker):
+    retire_worker(metrics_dir, worker.pid)
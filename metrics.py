@@ -0,0 +1,270 @@
+import contextvars
+import glob
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ROW_BUCKETS = (0, 1, 10, 50, 100, 200, 500, 1000, 5000)
+
+# SQL statements run by the current request, for the slow-request log
+_trace = contextvars.ContextVar("sql_trace", default=None)
+
+# Counters and histograms of exited workers, see retire_worker
+EXITED_FILE = "exited.json"
+
+
+class Metrics:
+    """In-process counters, histograms and gauges rendered in Prometheus text format.
+
+    Recording is a dict update under a lock. With ``directory`` set, a
+    background thread in each worker (a greenlet under gevent) writes a
+    snapshot there every ``flush_interval`` seconds when something changed,
+    and ``render`` merges the snapshots of every worker, so a scrape that
+    lands on any gunicorn worker reports the whole server. The gunicorn
+    hooks keep the directory to live workers (see gunicorn.conf.py).
+    """
+
+    def __init__(self, directory=None, flush_interval=1.0):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._descriptions = {}
+        self._gauge_callbacks = []
+        self._counter_callbacks = []
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self._flush_lock = threading.Lock()
+        self._written = None
+        self._flusher = None
+
+    def _check_pid(self):
+        # Numbers inherited from the gunicorn master belong to the master
+        if self._pid != os.getpid():
+            self._reset()
+        if self.directory and self._flusher is None:
+            # Started on first use so it belongs to the worker, not the master
+            self._flusher = threading.Thread(target=self._flush_loop, name="metrics-flush", daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self):
+        pid = self._pid
+        while self._pid == pid:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Metrics flush error: {e}")
+
+    def describe(self, name, kind, help_text, buckets=None):
+        self._descriptions[name] = (kind, help_text, buckets)
+
+    def add_gauges(self, callback):
+        """Register callback() -> [(name, labels, value)], sampled at render time"""
+        self._gauge_callbacks.append(callback)
+
+    def add_counters(self, callback):
+        """Like add_gauges, for running totals kept elsewhere (the connection pool)"""
+        self._counter_callbacks.append(callback)
+
+    def inc(self, name, labels=(), value=1):
+        self._check_pid()
+        key = (name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, value, labels=()):
+        self._check_pid()
+        buckets = self._descriptions[name][2]
+        key = (name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                # one count per bucket plus +Inf, then sum
+                histogram = self._histograms[key] = [0] * (len(buckets) + 1) + [0.0]
+            histogram[bisect_left(buckets, value)] += 1
+            histogram[-1] += value
+
+    # SQL tracing for the slow-request log
+
+    def start_trace(self):
+        return _trace.set([])
+
+    def stop_trace(self, token):
+        statements = _trace.get()
+        _trace.reset(token)
+        return statements or []
+
+    def trace_sql(self, sql, seconds):
+        statements = _trace.get()
+        if statements is not None:
+            statements.append((sql, seconds))
+
+    # Export
+
+    def _sample(self, callbacks):
+        samples = []
+        for callback in callbacks:
+            try:
+                samples.extend(callback())
+            except Exception as e:
+                print(f"Metrics callback error: {e}")
+        return samples
+
+    def _snapshot(self):
+        self._check_pid()
+        gauges = self._sample(self._gauge_callbacks)
+        sampled = self._sample(self._counter_callbacks)
+        with self._lock:
+            counters = [[name, list(labels), value] for (name, labels), value in self._counters.items()]
+            histograms = [[name, list(labels), list(values)]
+                          for (name, labels), values in self._histograms.items()]
+        return {
+            "pid": self._pid,
+            "counters": counters + [[name, list(labels), value] for name, labels, value in sampled],
+            "histograms": histograms,
+            "gauges": [[name, list(labels), value] for name, labels, value in gauges],
+        }
+
+    def flush(self):
+        """Write this worker's snapshot for the others to merge, if it changed"""
+        if self.directory:
+            self._write(self._snapshot())
+
+    def _write(self, snapshot):
+        with self._flush_lock:
+            if snapshot != self._written:
+                _write_json(os.path.join(self.directory, f"{snapshot['pid']}.json"), snapshot)
+                self._written = snapshot
+
+    def _snapshots(self):
+        own = self._snapshot()
+        snapshots = [own]
+        if self.directory:
+            # Publish what this scrape reports first: each worker's file then
+            # only grows, so totals never drop between scrapes answered by
+            # different workers.
+            self._write(own)
+            for path in glob.glob(os.path.join(self.directory, "*.json")):
+                snapshot = _read_json(path)
+                if snapshot is not None and snapshot["pid"] != own["pid"]:
+                    snapshots.append(snapshot)
+        return snapshots
+
+    def render(self):
+        counters, histograms, gauges = _merge(self._snapshots())
+
+        lines = []
+        for name, (kind, help_text, buckets) in sorted(self._descriptions.items()):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            if kind == "counter":
+                series = counters
+            elif kind == "gauge":
+                series = gauges
+            else:
+                series = {}
+                for (series_name, labels), values in sorted(histograms.items()):
+                    if series_name != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(list(buckets) + ["+Inf"], values[:-1]):
+                        cumulative += count
+                        le = bound if bound == "+Inf" else _format_value(bound)
+                        lines.append(f"{name}_bucket{_format_labels(labels + (('le', le),))} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(values[-1])}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+            for (series_name, labels), value in sorted(series.items()):
+                if series_name == name:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def reset_directory(directory):
+    """Drop the snapshots of a previous server; run by the gunicorn master at start"""
+    os.makedirs(directory, exist_ok=True)
+    for path in glob.glob(os.path.join(directory, "*.json*")):
+        os.remove(path)
+
+
+def retire_worker(directory, pid):
+    """Fold an exited worker's counters and histograms into EXITED_FILE.
+
+    Run by the gunicorn master once the worker is gone, so totals never go
+    backwards and the directory only holds live workers. Its gauges are dropped.
+    """
+    path = os.path.join(directory, f"{pid}.json")
+    snapshot = _read_json(path)
+    if snapshot is None:
+        return
+    exited_path = os.path.join(directory, EXITED_FILE)
+    exited = _read_json(exited_path) or {"pid": None, "counters": [], "histograms": [], "gauges": []}
+    snapshot["gauges"] = []
+    counters, histograms, _ = _merge([exited, snapshot])
+    _write_json(exited_path, {
+        "pid": None,
+        "counters": [[name, list(labels), value] for (name, labels), value in counters.items()],
+        "histograms": [[name, list(labels), values] for (name, labels), values in histograms.items()],
+        "gauges": [],
+    })
+    os.remove(path)
+
+
+def _merge(snapshots):
+    """Sum snapshots into (counters, histograms, gauges) keyed by (name, labels)"""
+    counters, histograms, gauges = {}, {}, {}
+    for snapshot in snapshots:
+        for name, labels, value in snapshot["counters"]:
+            key = (name, _freeze(labels))
+            counters[key] = counters.get(key, 0) + value
+        for name, labels, values in snapshot["histograms"]:
+            key = (name, _freeze(labels))
+            merged = histograms.get(key)
+            histograms[key] = values if merged is None else [a + b for a, b in zip(merged, values)]
+        for name, labels, value in snapshot["gauges"]:
+            key = (name, _freeze(labels))
+            gauges[key] = gauges.get(key, 0) + value
+    return counters, histograms, gauges
+
+
+def _read_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path, data):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(temp_path, path)
+
+
+def _freeze(labels):
+    return tuple(tuple(pair) for pair in labels)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
@@ -0,0 +1,35 @@
+import gzip
+
+from flask import Response, current_app, request
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+# Bodies smaller than this are not worth a Content-Encoding
+MIN_COMPRESS_SIZE = 1024
+
+
+def encode_json(payload):
+    """Serialize once and pre-compress, returns {encoding: body bytes}"""
+    body = current_app.json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    variants = {"identity": body}
+    if len(body) >= MIN_COMPRESS_SIZE:
+        variants["gzip"] = gzip.compress(body, compresslevel=6)
+        if brotli is not None:
+            variants["br"] = brotli.compress(body, quality=5)
+    return variants
+
+
+def encoded_response(variants, status=200):
+    """Serve the variant best matching the request's Accept-Encoding"""
+    offered = [encoding for encoding in ("br", "gzip") if encoding in variants]
+    encoding = request.accept_encodings.best_match(offered) if offered else None
+
+    response = Response(variants[encoding or "identity"], status=status,
+                        mimetype="application/json")
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    return response
@@ -1,13 +1,23 @@
 class TodoApp {
     constructor() {
         this.currentFilter = 'all';
+        this.searchQuery = '';
+        this.searchTimer = null;
         this.editingTaskId = null;
+        this.pageSize = 50;
+        this.nextCursor = null;
+        this.loadingMore = false;
+        this.loadToken = 0;
+        this.syncToken = null;
+        this.syncQueue = Promise.resolve();
         this.init();
     }
 
     init() {
         this.bindEvents();
+        this.observeLoadMore();
         this.loadTasks();
+        this.subscribeToChanges();
     }
 
     bindEvents() {
@@ -24,24 +34,221 @@ class TodoApp {
             });
         });
 
+        // Search box, debounced so typing does not send a request per key
+        document.getElementById('searchInput').addEventListener('input', (e) => {
+            clearTimeout(this.searchTimer);
+            this.searchTimer = setTimeout(() => {
+                this.setSearch(e.target.value.trim());
+            }, 250);
+        });
+
         // Edit modal save button
         document.getElementById('saveChanges').addEventListener('click', () => {
             this.saveTaskEdit();
         });
+
+        // Bulk actions
+        document.getElementById('completeAllBtn').addEventListener('click', () => {
+            this.completeAll();
+        });
+        document.getElementById('clearCompletedBtn').addEventListener('click', () => {
+            this.clearCompleted();
+        });
+
+        // Load more button (fallback when the observer is unavailable)
+        document.getElementById('loadMoreBtn').addEventListener('click', () => {
+            this.loadMoreTasks();
+        });
+    }
+
+    observeLoadMore() {
+        if (!('IntersectionObserver' in window)) {
+            return;
+        }
+        // Fetch the next page as soon as the load more row scrolls into view
+        const observer = new IntersectionObserver((entries) => {
+            if (entries.some(entry => entry.isIntersecting)) {
+                this.loadMoreTasks();
+            }
+        });
+        observer.observe(document.getElementById('loadMore'));
+    }
+
+    fetchTaskPage(cursor) {
+        const params = new URLSearchParams({ filter: this.currentFilter, limit: this.pageSize });
+        if (cursor) {
+            params.set('cursor', cursor);
+        }
+        let url = `/api/tasks?${params}`;
+        if (this.searchQuery) {
+            params.set('q', this.searchQuery);
+            url = `/api/tasks/search?${params}`;
+        }
+        return fetch(url).then(response => {
+            if (!response.ok) {
+                throw new Error('Failed to load tasks');
+            }
+            return response.json();
+        });
     }
 
     async loadTasks() {
+        // Responses from an older filter or reload are dropped
+        const token = ++this.loadToken;
+        this.nextCursor = null;
+        this.updateLoadMore();
         try {
             this.showLoading(true);
-            const response = await fetch(`/api/tasks?filter=${this.currentFilter}`);
-            const tasks = await response.json();
-            this.renderTasks(tasks);
+            const page = await this.fetchTaskPage(null);
+            if (token !== this.loadToken) {
+                return;
+            }
+            this.nextCursor = page.next_cursor;
+            this.syncToken = page.sync_token;
+            this.renderTasks(page.tasks);
+            if (page.truncated) {
+                this.showToast('Many tasks match, showing the best of the most recent. Refine your search to see more.', 'warning');
+            }
         } catch (error) {
             console.error('Error loading tasks:', error);
             this.showError('Failed to load tasks');
         } finally {
             this.showLoading(false);
+            this.updateLoadMore();
+        }
+    }
+
+    async loadMoreTasks() {
+        if (!this.nextCursor || this.loadingMore) {
+            return;
+        }
+        const token = this.loadToken;
+        this.loadingMore = true;
+        try {
+            const page = await this.fetchTaskPage(this.nextCursor);
+            if (token !== this.loadToken) {
+                return;
+            }
+            this.nextCursor = page.next_cursor;
+            this.appendTasks(page.tasks);
+        } catch (error) {
+            console.error('Error loading tasks:', error);
+            this.showError('Failed to load more tasks');
+        } finally {
+            this.loadingMore = false;
+            this.updateLoadMore();
+        }
+    }
+
+    subscribeToChanges() {
+        if (!('EventSource' in window)) {
+            return;
+        }
+        // Changes made in other tabs are pushed here; the browser reconnects on its own
+        const source = new EventSource('/api/tasks/events');
+        source.addEventListener('open', () => {
+            // Catch up on anything missed while disconnected
+            if (this.syncToken !== null) {
+                this.syncChanges();
+            }
+        });
+        source.addEventListener('changes', (event) => {
+            this.receiveChanges(JSON.parse(event.data));
+        });
+        source.addEventListener('resync', () => {
+            this.loadTasks();
+        });
+    }
+
+    receiveChanges(delta) {
+        this.syncQueue = this.syncQueue.then(() => {
+            if (this.syncToken === null) {
+                return;
+            }
+            const current = Number(this.syncToken);
+            if (Number(delta.sync_token) <= current) {
+                return;
+            }
+            if (Number(delta.since) > current) {
+                // A gap between our list and this delta, fetch our own
+                return this.fetchChanges();
+            }
+            this.applyChanges(delta);
+        });
+    }
+
+    syncChanges() {
+        // Run syncs one after another so an older delta never lands last
+        this.syncQueue = this.syncQueue.then(() => this.fetchChanges());
+        return this.syncQueue;
+    }
+
+    async fetchChanges() {
+        if (this.syncToken === null) {
+            return this.loadTasks();
+        }
+        const token = this.loadToken;
+        try {
+            const response = await fetch(`/api/tasks/changes?since=${encodeURIComponent(this.syncToken)}`);
+            if (response.status === 410) {
+                // Too far behind, start over from a fresh list
+                return this.loadTasks();
+            }
+            if (!response.ok) {
+                throw new Error('Failed to sync tasks');
+            }
+            const delta = await response.json();
+            if (token === this.loadToken) {
+                this.applyChanges(delta);
+            }
+        } catch (error) {
+            console.error('Error syncing tasks:', error);
+            this.loadTasks();
+        }
+    }
+
+    applyChanges(delta) {
+        if (this.searchQuery) {
+            // Only the server knows which changed tasks match and where they rank
+            return this.loadTasks();
+        }
+        const tasksList = document.getElementById('tasksList');
+        delta.deleted.forEach(id => this.removeTaskElement(id));
+        // Changes arrive oldest first, so prepending leaves the newest on top
+        delta.changed.forEach(task => {
+            this.removeTaskElement(task.id);
+            if (this.matchesFilter(task)) {
+                tasksList.insertAdjacentHTML('afterbegin', this.createTaskHTML(task));
+            }
+        });
+        this.syncToken = delta.sync_token;
+        this.updateEmptyState();
+    }
+
+    matchesFilter(task) {
+        if (this.currentFilter === 'completed') {
+            return Boolean(task.completed);
+        }
+        if (this.currentFilter === 'pending') {
+            return !task.completed;
         }
+        return true;
+    }
+
+    removeTaskElement(taskId) {
+        const element = document.querySelector(`[data-task-id="${taskId}"]`);
+        if (element) {
+            element.remove();
+        }
+    }
+
+    updateEmptyState() {
+        const isEmpty = document.getElementById('tasksList').children.length === 0;
+        document.getElementById('emptyState').classList.toggle('d-none', !isEmpty);
+    }
+
+    updateLoadMore() {
+        document.getElementById('loadMore').classList.toggle('d-none', !this.nextCursor);
     }
 
     async addTask() {
@@ -64,7 +271,7 @@ class TodoApp {
 
             if (response.ok) {
                 document.getElementById('taskForm').reset();
-                this.loadTasks();
+                this.syncChanges();
                 this.showSuccess('Task added successfully!');
             } else {
                 throw new Error('Failed to add task');
@@ -86,7 +293,7 @@ class TodoApp {
             });
 
             if (response.ok) {
-                this.loadTasks();
+                this.syncChanges();
                 this.showSuccess(completed ? 'Task completed!' : 'Task marked as pending');
             } else {
                 throw new Error('Failed to update task');
@@ -108,7 +315,7 @@ class TodoApp {
             });
 
             if (response.ok) {
-                this.loadTasks();
+                this.syncChanges();
                 this.showSuccess('Task deleted successfully!');
             } else {
                 throw new Error('Failed to delete task');
@@ -119,6 +326,48 @@ class TodoApp {
         }
     }
 
+    async completeAll() {
+        try {
+            const response = await fetch('/api/tasks/complete-all', {
+                method: 'POST',
+            });
+
+            if (response.ok) {
+                const result = await response.json();
+                this.syncChanges();
+                this.showSuccess(result.message);
+            } else {
+                throw new Error('Failed to complete tasks');
+            }
+        } catch (error) {
+            console.error('Error completing tasks:', error);
+            this.showError('Failed to complete tasks');
+        }
+    }
+
+    async clearCompleted() {
+        if (!confirm('Delete all completed tasks?')) {
+            return;
+        }
+
+        try {
+            const response = await fetch('/api/tasks/completed', {
+                method: 'DELETE',
+            });
+
+            if (response.ok) {
+                const result = await response.json();
+                this.syncChanges();
+                this.showSuccess(result.message);
+            } else {
+                throw new Error('Failed to delete completed tasks');
+            }
+        } catch (error) {
+            console.error('Error deleting completed tasks:', error);
+            this.showError('Failed to delete completed tasks');
+        }
+    }
+
     openEditModal(task) {
         this.editingTaskId = task.id;
         document.getElementById('editTitle').value = task.title;
@@ -149,7 +398,7 @@ class TodoApp {
             if (response.ok) {
                 const modal = bootstrap.Modal.getInstance(document.getElementById('editModal'));
                 modal.hide();
-                this.loadTasks();
+                this.syncChanges();
                 this.showSuccess('Task updated successfully!');
             } else {
                 throw new Error('Failed to update task');
@@ -172,6 +421,14 @@ class TodoApp {
         this.loadTasks();
     }
 
+    setSearch(query) {
+        if (query === this.searchQuery) {
+            return;
+        }
+        this.searchQuery = query;
+        this.loadTasks();
+    }
+
     renderTasks(tasks) {
         const tasksList = document.getElementById('tasksList');
         const emptyState = document.getElementById('emptyState');
@@ -186,6 +443,11 @@ class TodoApp {
         tasksList.innerHTML = tasks.map(task => this.createTaskHTML(task)).join('');
     }
 
+    appendTasks(tasks) {
+        const tasksList = document.getElementById('tasksList');
+        tasksList.insertAdjacentHTML('beforeend', tasks.map(task => this.createTaskHTML(task)).join(''));
+    }
+
     createTaskHTML(task) {
         const createdAt = new Date(task.created_at).toLocaleDateString();
         const completedClass = task.completed ? 'completed' : '';
@@ -194,7 +456,7 @@ class TodoApp {
             '<div class="status-badge pending"></div>';
 
         return `
-            <div class="task-card ${completedClass}" style="position: relative;">
+            <div class="task-card ${completedClass}" data-task-id="${task.id}" style="position: relative;">
                 ${statusBadge}
                 <div class="card-body">
                     <div class="d-flex align-items-start">
@@ -0,0 +1,820 @@
+import os
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import mysql.connector
+
+from db_pool import ConnectionPool
+
+TASK_COLUMNS = "id, title, description, completed, created_at, updated_at"
+# Qualified for search queries, which join tasks with the full-text index
+SEARCH_COLUMNS = ", ".join(f"tasks.{column}" for column in TASK_COLUMNS.split(", "))
+MAX_SEARCH_TERMS = 8
+# SQLite search ranks only this many of the newest matches, which bounds the
+# cost of terms found in most rows; selective queries never reach it
+SEARCH_RANK_WINDOW = 2000
+
+# Rows per multi-row INSERT / DELETE ... IN; keeps SQLite under its
+# 999 bound-parameter limit on older builds
+CHUNK_SIZE = 300
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def search_terms(query):
+    """Lowercased words of a search box query; operators and quotes are dropped"""
+    return re.findall(r"\w+", query.lower())[:MAX_SEARCH_TERMS]
+
+
+def _filter_condition(filter_type):
+    if filter_type == 'completed':
+        return "completed = TRUE"
+    if filter_type == 'pending':
+        return "completed = FALSE"
+    return None
+
+
+class TaskRepository:
+    """Task storage plus the version clock and tombstones used for sync.
+
+    Queries are shared and written with ``%s`` placeholders; subclasses
+    supply the connection pool, the schema and a few dialect hooks.
+
+    Every write runs in its own transaction that first takes the next table
+    version from the ``task_clock`` row. The row stays locked until commit,
+    so versions are handed out in commit order and stamped on the rows the
+    write touches (``tasks.row_version``, ``task_tombstones.row_version``).
+    """
+
+    Error = Exception
+    placeholder = "%s"
+    # Appended to the row-existence check in apply_batch
+    lock_rows = ""
+    # Rank only the newest N matches of a search (None ranks them all)
+    search_rank_window = None
+    # Seconds between tombstone prunes run by the delete paths, per process
+    prune_interval = 3600
+
+    def __init__(self, pool, metrics=None):
+        self.pool = pool
+        self.metrics = metrics
+        self._pruned_at = None
+
+    # Dialect hooks
+
+    def init_schema(self):
+        raise NotImplementedError
+
+    def _dict_cursor(self, connection):
+        raise NotImplementedError
+
+    def _begin_read(self, connection):
+        pass
+
+    def _begin_write(self, connection):
+        pass
+
+    def _next_version(self, cursor):
+        raise NotImplementedError
+
+    def _first_insert_id(self, cursor, count):
+        """Id of the first row of the multi-row INSERT just run"""
+        return cursor.lastrowid
+
+    def _days_ago(self, days):
+        """(SQL expression, parameter) for the timestamp `days` days ago"""
+        raise NotImplementedError
+
+    def _search_query(self, terms):
+        """(FROM clause, task id column, score expression, match condition, params)
+        matching every term as a prefix; a higher score ranks first"""
+        raise NotImplementedError
+
+    # Helpers
+
+    def _sql(self, sql):
+        return sql if self.placeholder == "%s" else sql.replace("%s", self.placeholder)
+
+    def _timed(self, phase, started, sql=None):
+        elapsed = time.perf_counter() - started
+        if self.metrics is not None:
+            self.metrics.observe("task_db_seconds", elapsed, (("phase", phase),))
+            if sql is not None:
+                self.metrics.trace_sql(sql, elapsed)
+
+    def _open_connection(self):
+        """Pool creator; times the connect handshake"""
+        started = time.perf_counter()
+        connection = self._connect()
+        self._timed("connect", started)
+        return connection
+
+    def _execute(self, cursor, sql, params=()):
+        sql = self._sql(sql)
+        started = time.perf_counter()
+        cursor.execute(sql, params)
+        self._timed("query", started, sql)
+
+    def _executemany(self, cursor, sql, rows):
+        sql = self._sql(sql)
+        started = time.perf_counter()
+        cursor.executemany(sql, rows)
+        self._timed("query", started, sql)
+
+    def _fetchall(self, cursor):
+        started = time.perf_counter()
+        rows = cursor.fetchall()
+        self._timed("fetch", started)
+        if self.metrics is not None:
+            self.metrics.observe("task_db_rows", len(rows))
+        return rows
+
+    def _fetchone(self, cursor):
+        started = time.perf_counter()
+        row = cursor.fetchone()
+        self._timed("fetch", started)
+        return row
+
+    @contextmanager
+    def _reading(self):
+        """Connection holding one consistent snapshot for several reads"""
+        with self.pool.connection() as connection:
+            self._begin_read(connection)
+            yield connection
+
+    @contextmanager
+    def _writing(self):
+        """(connection, cursor, version) for one write; the caller commits or rolls back"""
+        with self.pool.connection() as connection:
+            self._begin_write(connection)
+            cursor = connection.cursor()
+            try:
+                yield connection, cursor, self._next_version(cursor)
+            finally:
+                cursor.close()
+
+    def _version(self, connection):
+        cursor = connection.cursor()
+        self._execute(cursor, "SELECT version, pruned_version FROM task_clock WHERE id = 1")
+        row = self._fetchone(cursor)
+        cursor.close()
+        return row
+
+    # Reads
+
+    def version(self):
+        """Return (version, pruned_version) of the tasks table"""
+        with self._reading() as connection:
+            return self._version(connection)
+
+    def list_page(self, filter_type, limit, after=None):
+        """One page ordered by (updated_at, id) DESC.
+
+        Returns (tasks, has_more, version). The version is read
+        first, so a client syncing from it never misses a change to the page.
+        """
+        conditions = []
+        params = []
+
+        condition = _filter_condition(filter_type)
+        if condition:
+            conditions.append(condition)
+
+        if after is not None:
+            # The leading updated_at <= bound lets the planner seek the index
+            # instead of scanning from the newest row and filtering
+            conditions.append("updated_at <= %s AND (updated_at < %s OR (updated_at = %s AND id < %s))")
+            params.extend([after[0], after[0], after[0], after[1]])
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params.append(limit + 1)
+
+        with self._reading() as connection:
+            version, _ = self._version(connection)
+            cursor = self._dict_cursor(connection)
+            self._execute(
+                cursor,
+                f"SELECT {TASK_COLUMNS} FROM tasks {where} "
+                "ORDER BY updated_at DESC, id DESC LIMIT %s",
+                params
+            )
+            tasks = self._fetchall(cursor)
+            cursor.close()
+
+        return tasks[:limit], len(tasks) > limit, version
+
+    def search(self, terms, filter_type, limit, offset=0):
+        """One page of tasks matching all `terms`, best match first.
+
+        Returns (tasks, has_more, truncated, version). truncated is set when
+        the query matched more tasks than ``search_rank_window`` and only
+        the newest of them were ranked.
+        """
+        source, id_column, score, condition, params = self._search_query(terms)
+        conditions = [condition]
+        filter_condition = _filter_condition(filter_type)
+        if filter_condition:
+            conditions.append(filter_condition)
+        where = " AND ".join(conditions)
+        window = self.search_rank_window
+        truncated = False
+
+        with self._reading() as connection:
+            version, _ = self._version(connection)
+            cursor = self._dict_cursor(connection)
+            if window is None:
+                self._execute(
+                    cursor,
+                    f"SELECT {SEARCH_COLUMNS}, {score} AS score FROM {source} WHERE {where} "
+                    "ORDER BY score DESC, tasks.id DESC LIMIT %s OFFSET %s",
+                    list(params) + [limit + 1, offset]
+                )
+                tasks = self._fetchall(cursor)
+            else:
+                self._execute(
+                    cursor,
+                    f"SELECT {SEARCH_COLUMNS}, COUNT(*) OVER () AS ranked, MIN(matches.id) OVER () AS oldest "
+                    f"FROM (SELECT {id_column} AS id, {score} AS score FROM {source} WHERE {where} "
+                    f"ORDER BY {id_column} DESC LIMIT %s) AS matches JOIN tasks ON tasks.id = matches.id "
+                    "ORDER BY matches.score DESC, tasks.id DESC LIMIT %s OFFSET %s",
+                    list(params) + [window, limit + 1, offset]
+                )
+                tasks = self._fetchall(cursor)
+                if tasks and tasks[0]['ranked'] == window:
+                    # A full window; truncated if any older task matches too
+                    self._execute(
+                        cursor,
+                        f"SELECT 1 FROM {source} WHERE {where} AND {id_column} < %s LIMIT 1",
+                        list(params) + [tasks[0]['oldest']]
+                    )
+                    truncated = self._fetchone(cursor) is not None
+            cursor.close()
+
+        for task in tasks:
+            for column in ('score', 'ranked', 'oldest'):
+                task.pop(column, None)
+        return tasks[:limit], len(tasks) > limit, truncated, version
+
+    def changes(self, since, max_changes):
+        """Tasks changed and ids deleted since a version.
+
+        Returns (delta, error); error is set when `since` predates pruned
+        tombstones or the delta is larger than `max_changes`.
+        """
+        with self._reading() as connection:
+            version, pruned_version = self._version(connection)
+            if since < pruned_version:
+                return None, 'Sync token expired, reload the list'
+            if since >= version:
+                return {'changed': [], 'deleted': [], 'sync_token': str(version)}, None
+
+            cursor = self._dict_cursor(connection)
+            self._execute(
+                cursor,
+                f"SELECT {TASK_COLUMNS} FROM tasks "
+                "WHERE row_version > %s AND row_version <= %s ORDER BY row_version LIMIT %s",
+                (since, version, max_changes + 1)
+            )
+            changed = self._fetchall(cursor)
+            self._execute(
+                cursor,
+                "SELECT id FROM task_tombstones "
+                "WHERE row_version > %s AND row_version <= %s LIMIT %s",
+                (since, version, max_changes + 1)
+            )
+            deleted = [row['id'] for row in self._fetchall(cursor)]
+            cursor.close()
+
+        if len(changed) + len(deleted) > max_changes:
+            return None, 'Too many changes, reload the list'
+
+        return {'changed': changed, 'deleted': deleted, 'sync_token': str(version)}, None
+
+    # Writes
+
+    def create(self, title, description):
+        """Insert a task, returns its id"""
+        with self._writing() as (connection, cursor, version):
+            self._execute(
+                cursor,
+                "INSERT INTO tasks (title, description, row_version) VALUES (%s, %s, %s)",
+                (title, description, version)
+            )
+            task_id = cursor.lastrowid
+            connection.commit()
+        return task_id
+
+    def update(self, task_id, fields):
+        """Update the given columns, returns False if the task does not exist"""
+        assignments = [f"{column} = %s" for column in fields]
+        query = (
+            f"UPDATE tasks SET {', '.join(assignments)}, "
+            "updated_at = CURRENT_TIMESTAMP, row_version = %s WHERE id = %s"
+        )
+        with self._writing() as (connection, cursor, version):
+            self._execute(cursor, query, list(fields.values()) + [version, task_id])
+            updated = cursor.rowcount
+            if updated:
+                connection.commit()
+            else:
+                connection.rollback()
+        return bool(updated)
+
+    def delete(self, task_id):
+        """Delete a task leaving a tombstone, returns False if it does not exist"""
+        with self._writing() as (connection, cursor, version):
+            self._execute(cursor, "DELETE FROM tasks WHERE id = %s", (task_id,))
+            deleted = cursor.rowcount
+            if deleted:
+                self._execute(
+                    cursor,
+                    "INSERT INTO task_tombstones (id, row_version) VALUES (%s, %s)",
+                    (task_id, version)
+                )
+                self._maybe_prune(cursor)
+                connection.commit()
+            else:
+                connection.rollback()
+        return bool(deleted)
+
+    def complete_all(self):
+        """Mark every pending task completed, returns the number changed"""
+        with self._writing() as (connection, cursor, version):
+            self._execute(
+                cursor,
+                "UPDATE tasks SET completed = TRUE, updated_at = CURRENT_TIMESTAMP, "
+                "row_version = %s WHERE completed = FALSE",
+                (version,)
+            )
+            updated = cursor.rowcount
+            if updated:
+                connection.commit()
+            else:
+                connection.rollback()
+        return updated
+
+    def delete_completed(self):
+        """Delete every completed task, returns the number deleted"""
+        with self._writing() as (connection, cursor, version):
+            self._execute(
+                cursor,
+                "INSERT INTO task_tombstones (id, row_version) "
+                "SELECT id, %s FROM tasks WHERE completed = TRUE",
+                (version,)
+            )
+            self._execute(cursor, "DELETE FROM tasks WHERE completed = TRUE")
+            deleted = cursor.rowcount
+            if deleted:
+                self._maybe_prune(cursor)
+                connection.commit()
+            else:
+                connection.rollback()
+        return deleted
+
+    def apply_batch(self, grouped, results, best_effort):
+        """Apply validated batch operations in one transaction.
+
+        `grouped` maps "create"/"update"/"delete" to lists of (index,
+        operation); outcomes are written into `results` by index. Returns
+        (committed, error).
+        """
+        with self._writing() as (connection, cursor, version):
+            # Check the targeted rows once to report missing ids per item
+            targets = grouped['update'] + grouped['delete']
+            existing = set()
+            for chunk in _chunks(sorted({operation['id'] for _, operation in targets}), CHUNK_SIZE):
+                placeholders = ", ".join(["%s"] * len(chunk))
+                self._execute(
+                    cursor,
+                    f"SELECT id FROM tasks WHERE id IN ({placeholders}){self.lock_rows}",
+                    chunk
+                )
+                existing.update(row[0] for row in self._fetchall(cursor))
+            for kind in ('update', 'delete'):
+                found = []
+                for index, operation in grouped[kind]:
+                    if operation['id'] in existing:
+                        found.append((index, operation))
+                    else:
+                        results[index] = {'index': index, 'status': 404, 'error': 'Task not found'}
+                grouped[kind] = found
+
+            # Delete each id once (it gets one tombstone); repeats share the first outcome
+            first_delete = {}
+            repeats = []
+            for index, operation in grouped['delete']:
+                if operation['id'] in first_delete:
+                    repeats.append((index, first_delete[operation['id']]))
+                else:
+                    first_delete[operation['id']] = index
+            repeated = {index for index, _ in repeats}
+            grouped['delete'] = [item for item in grouped['delete'] if item[0] not in repeated]
+
+            if not best_effort and any(results):
+                connection.rollback()
+                return False, None
+
+            try:
+                self._apply_group(cursor, self._insert_tasks, grouped['create'], version, results, best_effort)
+                self._apply_group(cursor, self._update_tasks, grouped['update'], version, results, best_effort)
+                self._apply_group(cursor, self._delete_tasks, grouped['delete'], version, results, best_effort)
+            except self.Error as e:
+                connection.rollback()
+                print(f"Batch rolled back: {e}")
+                return False, 'Batch could not be applied'
+            for index, first in repeats:
+                results[index] = dict(results[first], index=index)
+
+            if grouped['delete']:
+                self._maybe_prune(cursor)
+            connection.commit()
+        return True, None
+
+    def _apply_group(self, cursor, runner, items, version, results, best_effort):
+        """Run a group in one go; in best-effort mode retry item by item on failure"""
+        if not items:
+            return
+        if not best_effort:
+            runner(cursor, items, version, results)
+            return
+        self._execute(cursor, "SAVEPOINT batch_group")
+        try:
+            runner(cursor, items, version, results)
+            return
+        except self.Error:
+            self._execute(cursor, "ROLLBACK TO SAVEPOINT batch_group")
+        for item in items:
+            self._execute(cursor, "SAVEPOINT batch_item")
+            try:
+                runner(cursor, [item], version, results)
+            except self.Error as e:
+                self._execute(cursor, "ROLLBACK TO SAVEPOINT batch_item")
+                print(f"Batch item {item[0]} failed: {e}")
+                results[item[0]] = {'index': item[0], 'status': 400, 'error': 'Operation could not be applied'}
+
+    def _insert_tasks(self, cursor, items, version, results):
+        # Multi-row INSERT; ids of one statement are allocated consecutively
+        for chunk in _chunks(items, CHUNK_SIZE):
+            placeholders = ", ".join(["(%s, %s, %s)"] * len(chunk))
+            values = []
+            for _, operation in chunk:
+                values.extend([operation['title'], operation['description'], version])
+            self._execute(
+                cursor,
+                f"INSERT INTO tasks (title, description, row_version) VALUES {placeholders}",
+                values
+            )
+            first_id = self._first_insert_id(cursor, len(chunk))
+            for offset, (index, _) in enumerate(chunk):
+                results[index] = {'index': index, 'status': 201, 'id': first_id + offset}
+
+    def _update_tasks(self, cursor, items, version, results):
+        # executemany per distinct set of columns being changed
+        groups = {}
+        for index, operation in items:
+            groups.setdefault(tuple(operation['fields']), []).append((index, operation))
+        for columns, group in groups.items():
+            assignments = ", ".join(f"{column} = %s" for column in columns)
+            self._executemany(
+                cursor,
+                f"UPDATE tasks SET {assignments}, updated_at = CURRENT_TIMESTAMP, "
+                "row_version = %s WHERE id = %s",
+                [[operation['fields'][column] for column in columns] + [version, operation['id']]
+                 for _, operation in group]
+            )
+            for index, operation in group:
+                results[index] = {'index': index, 'status': 200, 'id': operation['id']}
+
+    def _delete_tasks(self, cursor, items, version, results):
+        for chunk in _chunks(items, CHUNK_SIZE):
+            ids = [operation['id'] for _, operation in chunk]
+            placeholders = ", ".join(["%s"] * len(chunk))
+            self._execute(cursor, f"DELETE FROM tasks WHERE id IN ({placeholders})", ids)
+            self._executemany(
+                cursor,
+                "INSERT INTO task_tombstones (id, row_version) VALUES (%s, %s)",
+                [(task_id, version) for task_id in ids]
+            )
+            for index, operation in chunk:
+                results[index] = {'index': index, 'status': 200, 'id': operation['id']}
+
+    def _maybe_prune(self, cursor):
+        """Prune tombstones from a delete's transaction, at most once per prune_interval"""
+        now = time.monotonic()
+        if self._pruned_at is None or now - self._pruned_at >= self.prune_interval:
+            self._pruned_at = now
+            self.prune_tombstones(cursor, self.tombstone_retention_days)
+
+    def prune_tombstones(self, cursor, days):
+        """Drop old tombstones; clients synced from before them must reload"""
+        older_than, param = self._days_ago(days)
+        self._execute(
+            cursor,
+            f"SELECT COALESCE(MAX(row_version), 0) FROM task_tombstones WHERE deleted_at < {older_than}",
+            (param,)
+        )
+        pruned_version = self._fetchone(cursor)[0]
+        if pruned_version:
+            self._execute(cursor, "DELETE FROM task_tombstones WHERE row_version <= %s", (pruned_version,))
+            self._execute(
+                cursor,
+                "UPDATE task_clock SET pruned_version = %s WHERE id = 1 AND pruned_version < %s",
+                (pruned_version, pruned_version)
+            )
+
+
+class MySQLTaskRepository(TaskRepository):
+    """Tasks in MySQL, one connection pool per worker"""
+
+    Error = mysql.connector.Error
+    lock_rows = " FOR UPDATE"
+
+    # (index name, columns) backing the keyset queries in list_page and the
+    # row_version scan in changes
+    TASK_INDEXES = [
+        ("idx_tasks_updated", "updated_at, id"),
+        ("idx_tasks_completed_updated", "completed, updated_at, id"),
+        ("idx_tasks_row_version", "row_version"),
+    ]
+    # FULLTEXT index behind search
+    SEARCH_INDEX = ("ft_tasks_search", "title, description")
+
+    def __init__(self, config, ssl_ca=None, tombstone_retention_days=7, metrics=None, **pool_options):
+        self.config = config
+        self.ssl_ca = ssl_ca
+        self.tombstone_retention_days = tombstone_retention_days
+        super().__init__(ConnectionPool(
+            self._open_connection, ping=lambda conn: conn.ping(reconnect=False), **pool_options
+        ), metrics)
+
+    def _apply_ssl(self, cfg):
+        if self.ssl_ca:
+            if not os.path.isfile(self.ssl_ca):
+                raise RuntimeError(f"DB_SSL_CA file not found: {self.ssl_ca}")
+            cfg.update({"ssl_ca": self.ssl_ca, "ssl_verify_cert": True})
+        return cfg
+
+    def _connect(self):
+        cfg = self._apply_ssl(self.config.copy())
+        if _socket_is_patched():
+            cfg["use_pure"] = True  # the C extension would block the gevent loop
+        return mysql.connector.connect(**cfg)
+
+    def _dict_cursor(self, connection):
+        return connection.cursor(dictionary=True)
+
+    def _next_version(self, cursor):
+        self._execute(cursor, "UPDATE task_clock SET version = LAST_INSERT_ID(version + 1) WHERE id = 1")
+        return cursor.lastrowid  # LAST_INSERT_ID(expr) is reported as the insert id
+
+    def _days_ago(self, days):
+        return "NOW() - INTERVAL %s DAY", days
+
+    def _search_query(self, terms):
+        # Terms shorter than innodb_ft_min_token_size (3 by default) or on the
+        # stopword list are ignored by the index
+        match = "MATCH (title, description) AGAINST (%s IN BOOLEAN MODE)"
+        query = " ".join(f"+{term}*" for term in terms)
+        return "tasks", "tasks.id", match, match, (query, query)
+
+    def init_schema(self):
+        """Create the database and tables and run migrations"""
+        cfg = self.config.copy()
+        cfg.pop("database", None)
+        cfg = self._apply_ssl(cfg)
+        print(f"Initializing DB connection to {cfg['host']}:{cfg['port']}")
+        connection = mysql.connector.connect(**cfg)
+        cursor = connection.cursor()
+
+        # Create database if it doesn't exist
+        cursor.execute("CREATE DATABASE IF NOT EXISTS todo_app")
+        cursor.execute("USE todo_app")
+
+        # Create tasks table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                title VARCHAR(255) NOT NULL,
+                description TEXT,
+                completed BOOLEAN DEFAULT FALSE,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                row_version BIGINT NOT NULL DEFAULT 0
+            )
+        """)
+
+        self._migrate_schema(cursor)
+
+        connection.commit()
+        cursor.close()
+        connection.close()
+
+    def _migrate_schema(self, cursor):
+        """Bring an existing schema up to date; safe to run repeatedly"""
+        # task_clock holds the table version, see TaskRepository
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS task_clock (
+                id TINYINT PRIMARY KEY,
+                version BIGINT NOT NULL DEFAULT 0,
+                pruned_version BIGINT NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+            )
+        """)
+        cursor.execute("INSERT IGNORE INTO task_clock (id) VALUES (1)")
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS task_tombstones (
+                id INT PRIMARY KEY,
+                row_version BIGINT NOT NULL,
+                deleted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                INDEX idx_tombstones_row_version (row_version)
+            )
+        """)
+
+        cursor.execute(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_schema = DATABASE() AND table_name = 'tasks'"
+        )
+        columns = {row[0].lower() for row in cursor.fetchall()}
+        if "row_version" not in columns:
+            print("Adding column tasks.row_version")
+            cursor.execute("ALTER TABLE tasks ADD COLUMN row_version BIGINT NOT NULL DEFAULT 0")
+
+        cursor.execute(
+            "SELECT DISTINCT index_name FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = 'tasks'"
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+        for name, columns in self.TASK_INDEXES:
+            if name not in existing:
+                print(f"Adding index {name} ({columns})")
+                cursor.execute(f"CREATE INDEX {name} ON tasks ({columns})")
+        name, columns = self.SEARCH_INDEX
+        if name not in existing:
+            print(f"Adding full-text index {name} ({columns})")
+            cursor.execute(f"CREATE FULLTEXT INDEX {name} ON tasks ({columns})")
+
+        self.prune_tombstones(cursor, self.tombstone_retention_days)
+
+
+def _socket_is_patched():
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched("socket")
+
+
+# SQLite keeps CURRENT_TIMESTAMP as "YYYY-MM-DD HH:MM:SS" text; map it to and
+# from datetime like the MySQL driver does
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+sqlite3.register_converter("TIMESTAMP", lambda value: datetime.fromisoformat(value.decode()))
+
+
+class SQLiteTaskRepository(TaskRepository):
+    """Tasks in a local SQLite file in WAL mode, for development, CI and benchmarks.
+
+    WAL lets readers run alongside the single writer; writes take the
+    database lock up front with BEGIN IMMEDIATE instead of upgrading later.
+    """
+
+    Error = sqlite3.Error
+    placeholder = "?"
+    # bm25 scores every match, so broad terms would cost O(matches)
+    search_rank_window = SEARCH_RANK_WINDOW
+
+    def __init__(self, path, busy_timeout=30.0, tombstone_retention_days=7, metrics=None, **pool_options):
+        if path == ":memory:":
+            raise ValueError("SQLite backend needs a file path; each pooled connection "
+                             "would get its own :memory: database")
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.tombstone_retention_days = tombstone_retention_days
+        super().__init__(ConnectionPool(self._open_connection, **pool_options), metrics)
+
+    def _connect(self):
+        connection = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            isolation_level=None,  # transactions are started explicitly
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _dict_cursor(self, connection):
+        cursor = connection.cursor()
+        cursor.row_factory = _dict_row
+        return cursor
+
+    def _begin_read(self, connection):
+        connection.execute("BEGIN")
+
+    def _begin_write(self, connection):
+        connection.execute("BEGIN IMMEDIATE")
+
+    def _next_version(self, cursor):
+        self._execute(
+            cursor,
+            "UPDATE task_clock SET version = version + 1, updated_at = CURRENT_TIMESTAMP WHERE id = 1"
+        )
+        self._execute(cursor, "SELECT version FROM task_clock WHERE id = 1")
+        return self._fetchone(cursor)[0]
+
+    def _first_insert_id(self, cursor, count):
+        # SQLite reports the id of the last row of the statement
+        return cursor.lastrowid - count + 1
+
+    def _days_ago(self, days):
+        return "datetime('now', ?)", f"-{int(days)} days"
+
+    def _search_query(self, terms):
+        # bm25 is lower for better matches; title hits weigh more than description
+        query = " ".join(f'"{term}"*' for term in terms)
+        return ("tasks_fts JOIN tasks ON tasks.id = tasks_fts.rowid", "tasks_fts.rowid",
+                "-bm25(tasks_fts, 10.0, 1.0)", "tasks_fts MATCH %s", (query,))
+
+    def init_schema(self):
+        """Create the tables and indexes; safe to run repeatedly"""
+        print(f"Initializing SQLite database at {self.path}")
+        with self.pool.connection() as connection:
+            has_search_index = connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'"
+            ).fetchone()
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title VARCHAR(255) NOT NULL,
+                    description TEXT,
+                    completed BOOLEAN NOT NULL DEFAULT FALSE,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    row_version BIGINT NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_tasks_updated ON tasks (updated_at, id);
+                CREATE INDEX IF NOT EXISTS idx_tasks_completed_updated ON tasks (completed, updated_at, id);
+                CREATE INDEX IF NOT EXISTS idx_tasks_row_version ON tasks (row_version);
+
+                CREATE TABLE IF NOT EXISTS task_clock (
+                    id INTEGER PRIMARY KEY,
+                    version BIGINT NOT NULL DEFAULT 0,
+                    pruned_version BIGINT NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+                INSERT OR IGNORE INTO task_clock (id) VALUES (1);
+
+                CREATE TABLE IF NOT EXISTS task_tombstones (
+                    id INTEGER PRIMARY KEY,
+                    row_version BIGINT NOT NULL,
+                    deleted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+                CREATE INDEX IF NOT EXISTS idx_tombstones_row_version ON task_tombstones (row_version);
+
+                -- Full-text index over tasks for search, kept in step by triggers
+                CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+                    title, description, content='tasks', content_rowid='id', prefix='2 3'
+                );
+                CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+                    INSERT INTO tasks_fts (rowid, title, description)
+                    VALUES (new.id, new.title, new.description);
+                END;
+                CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+                    INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+                    VALUES ('delete', old.id, old.title, old.description);
+                END;
+                CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+                    INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+                    VALUES ('delete', old.id, old.title, old.description);
+                    INSERT INTO tasks_fts (rowid, title, description)
+                    VALUES (new.id, new.title, new.description);
+                END;
+            """)
+            if not has_search_index:
+                print("Building full-text index tasks_fts")
+                connection.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+            connection.execute("BEGIN IMMEDIATE")
+            cursor = connection.cursor()
+            self.prune_tombstones(cursor, self.tombstone_retention_days)
+            cursor.close()
+            connection.commit()
+
+
+def _dict_row(cursor, row):
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+
+def create_repository(backend, **options):
+    """Build the repository named by TASK_STORE ("mysql" or "sqlite")"""
+    if backend == "mysql":
+        return MySQLTaskRepository(**options)
+    if backend == "sqlite":
+        return SQLiteTaskRepository(**options)
+    raise ValueError(f"Unknown TASK_STORE: {backend!r}")
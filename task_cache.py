@@ -0,0 +1,130 @@
+import fcntl
+import os
+import time
+import uuid
+import zlib
+from contextlib import contextmanager
+
+GENERATION_KEY = "tasks_generation"
+# Two keys sharing a file only means one waits briefly for the other's fill
+FILL_LOCK_FILES = 64
+
+
+class TaskCache:
+    """Generation-keyed cache shared by every worker.
+
+    Entries are stored under ``<key>@<generation>``; ``invalidate`` bumps the
+    generation so every worker misses at once without deleting keys. Refills
+    are single-flight: one process loads while the others serve the last
+    value they can find (stale-while-revalidate) or wait for the fill.
+
+    With ``lock_dir`` set, the counter and fill locks use ``flock`` on files in
+    that directory (for FileSystemCache); keys share ``FILL_LOCK_FILES`` fill
+    lock files so search keys do not leave a file each. Otherwise they rely on the backend's
+    own atomic ``inc``/``add`` (RedisCache, or SimpleCache in one process).
+    """
+
+    def __init__(self, cache, lock_dir=None, lock_timeout=10.0, poll_interval=0.02):
+        self.cache = cache
+        self.lock_dir = lock_dir
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        if lock_dir:
+            os.makedirs(lock_dir, exist_ok=True)
+
+    @contextmanager
+    def _file_lock(self, name, blocking):
+        path = os.path.join(self.lock_dir, f"{name}.lock")
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+            try:
+                fcntl.flock(fd, flags)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def _fill_lock_name(self, key):
+        return f"fill_{zlib.crc32(key.encode()) % FILL_LOCK_FILES}"
+
+    @contextmanager
+    def _fill_lock(self, key):
+        if self.lock_dir:
+            with self._file_lock(self._fill_lock_name(key), blocking=False) as acquired:
+                yield acquired
+            return
+        lock_key = f"{key}@lock"
+        token = uuid.uuid4().hex
+        acquired = self.cache.add(lock_key, token, timeout=int(self.lock_timeout) or 1)
+        try:
+            yield acquired
+        finally:
+            if acquired and self.cache.get(lock_key) == token:
+                self.cache.delete(lock_key)
+
+    def generation(self):
+        generation = self.cache.get(GENERATION_KEY)
+        if generation is None:
+            # Seed from the clock so a lost counter never reuses an old generation
+            self.cache.add(GENERATION_KEY, time.time_ns(), timeout=0)
+            generation = self.cache.get(GENERATION_KEY)
+        return generation
+
+    def invalidate(self):
+        """Start a new generation, returns the new value"""
+        if self.lock_dir:
+            with self._file_lock("generation", blocking=True):
+                generation = self.generation() + 1
+                self.cache.set(GENERATION_KEY, generation, timeout=0)
+            return generation
+        self.generation()
+        return self.cache.cache.inc(GENERATION_KEY)  # the Flask-Caching wrapper has no inc
+
+    def get_or_fill(self, key, loader, timeout=None, keep_stale=True):
+        """Return (value, source) where source is "hit", "stale" or "fill".
+
+        With keep_stale=False no copy outlives its generation, for keys that
+        are many and rarely repeated; misses then wait for the filler.
+        """
+        generation = self.generation()
+        versioned_key = f"{key}@{generation}"
+        latest_key = f"{key}@latest"
+
+        value = self.cache.get(versioned_key)
+        if value is not None:
+            return value, "hit"
+
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            with self._fill_lock(key) as acquired:
+                if acquired:
+                    # Another process may have filled it while we were trying
+                    value = self.cache.get(versioned_key)
+                    if value is not None:
+                        return value, "hit"
+                    value = loader()
+                    self.cache.set(versioned_key, value, timeout=timeout)
+                    if keep_stale:
+                        latest = self.cache.get(latest_key)
+                        if latest is None or latest[0] <= generation:
+                            self.cache.set(latest_key, (generation, value), timeout=0)
+                    return value, "fill"
+
+            if keep_stale:
+                latest = self.cache.get(latest_key)
+                if latest is not None:
+                    return latest[1], "stale"
+
+            time.sleep(self.poll_interval)
+            value = self.cache.get(versioned_key)
+            if value is not None:
+                return value, "hit"
+            if time.monotonic() > deadline:
+                # The filler looks stuck; load without caching rather than block
+                return loader(), "fill"
@@ -0,0 +1,42 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# app.py reads its configuration at import time; run it against a throwaway
+# SQLite database and file cache
+_workdir = tempfile.mkdtemp(prefix="task_manager_tests_")
+os.environ.update({
+    "TASK_STORE": "sqlite",
+    "SQLITE_PATH": os.path.join(_workdir, "tasks.db"),
+    "CACHE_DIR": os.path.join(_workdir, "cache"),
+})
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as task_app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def app_module():
+    task_app.init_db()
+    return task_app
+
+
+@pytest.fixture
+def client(app_module):
+    """Test client over an empty task table"""
+    with app_module.tasks_repo.pool.connection() as connection:
+        connection.execute("DELETE FROM tasks")
+        connection.execute("DELETE FROM task_tombstones")
+    app_module.clear_cache()
+    return app_module.app.test_client()
+
+
+@pytest.fixture
+def create_task(client):
+    def create(title="Task", description=""):
+        response = client.post("/api/tasks", json={"title": title, "description": description})
+        assert response.status_code == 201
+        return response.get_json()["id"]
+    return create
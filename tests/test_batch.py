@@ -0,0 +1,82 @@
+def batch(client, operations, mode="atomic"):
+    return client.post("/api/tasks/batch", json={"operations": operations, "mode": mode})
+
+
+def task_ids(client):
+    response = client.get("/api/tasks", headers={"Accept-Encoding": "identity"})
+    return sorted(task["id"] for task in response.get_json()["tasks"])
+
+
+def test_atomic_batch_applies_every_item(client, create_task):
+    task_id = create_task()
+    response = batch(client, [
+        {"op": "create", "title": "New"},
+        {"op": "update", "id": task_id, "completed": True},
+    ])
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["committed"] is True
+    assert [result["status"] for result in body["results"]] == [201, 200]
+
+
+def test_rejected_atomic_batch_reports_every_item(client, create_task):
+    task_id = create_task()
+    response = batch(client, [
+        {"op": "create", "title": "New"},
+        {"op": "update", "id": task_id, "completed": True},
+        {"op": "delete", "id": task_id + 1000},
+    ])
+
+    assert response.status_code == 400
+    results = response.get_json()["results"]
+    assert [result["status"] for result in results] == [424, 424, 404]
+    assert [result["index"] for result in results] == [0, 1, 2]
+    assert task_ids(client) == [task_id]
+
+
+def test_invalid_item_rejects_atomic_batch(client):
+    response = batch(client, [{"op": "create", "title": "New"}, {"op": "create"}])
+
+    assert response.status_code == 400
+    assert [result["status"] for result in response.get_json()["results"]] == [424, 400]
+    assert task_ids(client) == []
+
+
+def test_best_effort_batch_skips_failing_items(client, create_task):
+    task_id = create_task()
+    response = batch(client, [
+        {"op": "delete", "id": task_id + 1000},
+        {"op": "delete", "id": task_id},
+    ], mode="best_effort")
+
+    assert response.status_code == 200
+    assert [result["status"] for result in response.get_json()["results"]] == [404, 200]
+    assert task_ids(client) == []
+
+
+def test_repeated_delete_in_one_batch(client, create_task):
+    task_id = create_task()
+    response = batch(client, [{"op": "delete", "id": task_id}, {"op": "delete", "id": task_id}])
+
+    assert response.status_code == 200
+    results = response.get_json()["results"]
+    assert [(result["index"], result["status"]) for result in results] == [(0, 200), (1, 200)]
+    assert task_ids(client) == []
+
+
+def test_repeated_delete_in_best_effort_batch(client, create_task):
+    task_id = create_task()
+    response = batch(client, [
+        {"op": "delete", "id": task_id},
+        {"op": "update", "id": task_id + 1000, "title": "Missing"},
+        {"op": "delete", "id": task_id},
+    ], mode="best_effort")
+
+    assert [result["status"] for result in response.get_json()["results"]] == [200, 404, 200]
+
+
+def test_body_must_be_an_object(client):
+    assert client.post("/api/tasks/batch", json=[1, 2]).status_code == 400
+    assert client.post("/api/tasks/batch", data="not json", content_type="application/json").status_code == 400
+    assert batch(client, []).status_code == 400
@@ -0,0 +1,167 @@
+import os
+import threading
+
+import pytest
+
+from db_pool import ConnectionPool, PoolTimeout
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.in_transaction = False
+        self.rollbacks = 0
+        self.ping_fails = False
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.in_transaction = False
+
+    def close(self):
+        self.closed = True
+
+
+def ping(connection):
+    if connection.ping_fails:
+        raise ConnectionError("gone away")
+
+
+def make_pool(**options):
+    created = []
+
+    def creator():
+        connection = FakeConnection()
+        created.append(connection)
+        return connection
+
+    return ConnectionPool(creator, ping=ping, **options), created
+
+
+def test_timeout_once_size_and_overflow_are_in_use():
+    pool, _ = make_pool(size=1, max_overflow=1, timeout=0.05)
+    with pool.connection(), pool.connection():
+        with pytest.raises(PoolTimeout):
+            with pool.connection():
+                pass
+    assert pool.stats()["timeouts"] == 1
+    assert pool.stats()["in_use"] == 0
+
+
+def test_waiter_gets_connection_released_by_another_thread():
+    pool, created = make_pool(size=1, max_overflow=0, timeout=5)
+    checked_out = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with pool.connection():
+            checked_out.set()
+            release.wait()
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    checked_out.wait()
+    threading.Timer(0.05, release.set).start()
+    with pool.connection() as connection:
+        assert connection is created[0]
+    thread.join()
+    assert pool.stats()["wait_time_max"] > 0
+
+
+def test_slot_released_when_creator_raises():
+    calls = []
+
+    def creator():
+        calls.append(1)
+        if len(calls) == 1:
+            raise ConnectionError("refused")
+        return FakeConnection()
+
+    pool = ConnectionPool(creator, size=1, max_overflow=0, timeout=0.05)
+    with pytest.raises(ConnectionError):
+        with pool.connection():
+            pass
+    assert pool.stats()["in_use"] == 0
+    with pool.connection() as connection:
+        assert isinstance(connection, FakeConnection)
+
+
+def test_connections_are_reused():
+    pool, created = make_pool(size=2)
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+    assert first is second
+    assert len(created) == 1
+
+
+def test_recycle_replaces_old_connection():
+    pool, created = make_pool(recycle=0)
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+    assert second is not first
+    assert first.closed
+    assert pool.stats()["recycled"] == 1
+
+
+def test_failed_ping_replaces_connection():
+    pool, created = make_pool()
+    with pool.connection() as first:
+        pass
+    first.ping_fails = True
+    with pool.connection() as second:
+        pass
+    assert second is not first
+    assert first.closed
+    assert pool.stats()["invalidated"] == 1
+
+
+def test_checkin_rolls_back_open_transaction():
+    pool, _ = make_pool()
+    with pool.connection() as connection:
+        connection.in_transaction = True
+    assert connection.rollbacks == 1
+    with pool.connection() as again:
+        assert again is connection
+    assert connection.rollbacks == 1  # nothing open the second time
+
+
+def test_checkin_discards_connection_whose_rollback_fails():
+    pool, _ = make_pool()
+    with pool.connection() as connection:
+        connection.in_transaction = True
+        connection.rollback = None  # calling it raises TypeError
+    assert connection.closed
+    assert pool.stats()["idle"] == 0
+
+
+def test_forked_child_drops_inherited_connections():
+    pool, created = make_pool()
+    with pool.connection():
+        pass
+    assert pool.stats()["idle"] == 1
+
+    pid = os.fork()
+    if pid == 0:
+        # In the child: the parent's socket must be neither reused nor closed
+        ok = False
+        try:
+            stats = pool.stats()
+            with pool.connection() as connection:
+                fresh = connection is not created[0]
+            ok = stats["idle"] == 0 and stats["checkouts"] == 0 and fresh and not created[0].closed
+        finally:
+            os._exit(0 if ok else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+    assert pool.stats()["idle"] == 1
+
+
+def test_pool_stats_endpoint(client):
+    client.get("/api/tasks")
+    stats = client.get("/api/db/pool").get_json()
+    assert stats["in_use"] == 0
+    assert stats["checkouts"] >= 1
+    assert set(stats) >= {"size", "max_overflow", "idle", "created", "timeouts", "wait_time_total"}
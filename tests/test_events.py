@@ -0,0 +1,107 @@
+import json
+import threading
+
+from events import ChangeFeed, format_event
+
+
+class Source:
+    """Stub generation counter, version clock and delta loader"""
+
+    def __init__(self):
+        self.generation = 1
+        self.version = 10
+        self.deltas = []
+        self.baseline_taken = threading.Event()
+
+    def get_generation(self):
+        return self.generation
+
+    def get_version(self):
+        self.baseline_taken.set()
+        return self.version
+
+    def load_changes(self, since):
+        self.since = since
+        return self.deltas.pop(0)
+
+
+def make_feed(source, **options):
+    return ChangeFeed(source.get_generation, source.load_changes, source.get_version,
+                      poll_interval=0.01, **options)
+
+
+def parse(message):
+    event, data = message.strip().split("\n")
+    return event.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+
+def test_generation_change_publishes_one_delta():
+    source = Source()
+    feed = make_feed(source)
+    subscription = feed.subscribe()
+    assert source.baseline_taken.wait(1)
+
+    source.deltas.append({"changed": [{"id": 1}], "deleted": [], "sync_token": "11"})
+    source.generation += 1
+    feed.notify()
+
+    event, payload = parse(subscription.get(timeout=1))
+    assert event == "changes"
+    assert payload == {"changed": [{"id": 1}], "deleted": [], "sync_token": "11", "since": "10"}
+    assert source.since == 10
+    assert subscription.get(timeout=0.05) is None
+    assert feed.stats() == {"subscribers": 1, "published": 1}
+    feed.unsubscribe(subscription)
+
+
+def test_unloadable_delta_publishes_resync():
+    source = Source()
+    feed = make_feed(source)
+    subscription = feed.subscribe()
+    assert source.baseline_taken.wait(1)
+
+    source.deltas.append(None)
+    source.version = 50
+    source.generation += 1
+    feed.notify()
+
+    assert parse(subscription.get(timeout=1)) == ("resync", {"sync_token": "50"})
+    feed.unsubscribe(subscription)
+
+
+def test_full_queue_marks_subscriber_overflowed():
+    feed = make_feed(Source(), max_queue=1)
+    slow = feed.subscribe()
+    feed.publish("changes", {"n": 1})
+    assert not slow.overflowed
+
+    feed.publish("changes", {"n": 2})
+    assert slow.overflowed
+    assert parse(slow.get(timeout=0)) == ("changes", {"n": 1})
+    feed.unsubscribe(slow)
+
+
+def test_thread_exits_after_last_subscriber_leaves():
+    feed = make_feed(Source())
+    first, second = feed.subscribe(), feed.subscribe()
+    thread = feed._thread
+
+    feed.unsubscribe(first)
+    feed.notify()
+    thread.join(0.1)
+    assert thread.is_alive()
+
+    feed.unsubscribe(second)
+    feed.notify()
+    thread.join(1)
+    assert not thread.is_alive()
+    assert feed._thread is None
+
+    # A new subscriber starts a fresh thread
+    third = feed.subscribe()
+    assert feed._thread is not None and feed._thread.is_alive()
+    feed.unsubscribe(third)
+
+
+def test_format_event():
+    assert format_event("changes", {"a": [1, 2]}) == 'event: changes\ndata: {"a":[1,2]}\n\n'
@@ -0,0 +1,80 @@
+import os
+import time
+
+from metrics import Metrics, reset_directory, retire_worker
+
+
+def make_metrics(directory):
+    metrics = Metrics(directory=directory)
+    metrics.describe("requests_total", "counter", "Requests")
+    metrics.describe("latency_seconds", "histogram", "Latency", (0.1, 1.0))
+    metrics.describe("in_use", "gauge", "In use")
+    return metrics
+
+
+def test_exited_worker_totals_are_kept(tmp_path):
+    directory = str(tmp_path)
+    reset_directory(directory)
+    worker = make_metrics(directory)
+    worker.inc("requests_total", value=3)
+    worker.observe("latency_seconds", 0.5)
+    worker.add_gauges(lambda: [("in_use", (), 2)])
+    worker.add_counters(lambda: [("requests_total", (("source", "pool"),), 7)])
+    worker.flush()
+
+    # Write the snapshot under a pid that is not ours, as another worker would
+    os.rename(os.path.join(directory, f"{os.getpid()}.json"), os.path.join(directory, "12345.json"))
+    retire_worker(directory, 12345)
+
+    assert sorted(os.listdir(directory)) == ["exited.json"]
+    text = make_metrics(directory).render()
+    assert "requests_total 3\n" in text
+    assert 'requests_total{source="pool"} 7\n' in text
+    assert 'latency_seconds_bucket{le="1.0"} 1\n' in text
+    assert "\nin_use " not in text
+
+
+def test_reset_directory_drops_previous_server(tmp_path):
+    directory = str(tmp_path)
+    (tmp_path / "999.json").write_text('{"pid": 999, "counters": [["requests_total", [], 5]], '
+                                       '"histograms": [], "gauges": []}')
+    reset_directory(directory)
+
+    assert "requests_total 5" not in make_metrics(directory).render()
+
+
+def test_idle_worker_is_merged_and_totals_never_drop(tmp_path):
+    directory = str(tmp_path)
+    reset_directory(directory)
+    metrics = make_metrics(directory)
+    metrics.flush_interval = 0.05
+    ready_r, ready_w = os.pipe()
+    go_r, go_w = os.pipe()
+    out_r, out_w = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            # A second worker: records, then serves nothing until the first
+            # worker has been scraped
+            metrics.add_gauges(lambda: [("in_use", (), 1)])
+            metrics.inc("requests_total", value=4)
+            os.write(ready_w, b"x")
+            os.read(go_r, 1)
+            os.write(out_w, metrics.render().encode())
+        finally:
+            os._exit(0)
+
+    os.close(out_w)
+    metrics.inc("requests_total", value=6)
+    os.read(ready_r, 1)
+    time.sleep(0.3)
+    first = metrics.render()
+    os.write(go_w, b"x")
+    with os.fdopen(out_r) as out:
+        second = out.read()
+    os.waitpid(pid, 0)
+
+    assert "requests_total 10\n" in first
+    assert "in_use 1\n" in first
+    assert "requests_total 10\n" in second
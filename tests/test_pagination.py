@@ -0,0 +1,63 @@
+IDENTITY = {"Accept-Encoding": "identity"}
+
+
+def page(client, **params):
+    response = client.get("/api/tasks", query_string=params, headers=IDENTITY)
+    return response.status_code, response.get_json()
+
+
+def test_cursor_walks_rows_sharing_updated_at(client, app_module, create_task):
+    ids = [create_task(f"Task {number}") for number in range(7)]
+    with app_module.tasks_repo.pool.connection() as connection:
+        connection.execute("UPDATE tasks SET updated_at = '2024-01-01 12:00:00'")
+    app_module.clear_cache()
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        status, body = page(client, **params)
+        assert status == 200
+        seen.extend(task["id"] for task in body["tasks"])
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+
+    assert seen == sorted(ids, reverse=True)
+
+
+def test_cursor_orders_by_updated_at_then_id(client, app_module, create_task):
+    older, newer, touched = create_task("Older"), create_task("Newer"), create_task("Touched")
+    with app_module.tasks_repo.pool.connection() as connection:
+        connection.execute("UPDATE tasks SET updated_at = '2024-01-01 12:00:00'")
+        connection.execute("UPDATE tasks SET updated_at = '2024-01-02 12:00:00' WHERE id = ?", (older,))
+    app_module.clear_cache()
+
+    _, first = page(client, limit=1)
+    _, rest = page(client, limit=5, cursor=first["next_cursor"])
+    assert [task["id"] for task in first["tasks"] + rest["tasks"]] == [older, touched, newer]
+    assert rest["next_cursor"] is None
+
+
+def test_filter_applies_across_pages(client, create_task):
+    ids = [create_task(f"Task {number}") for number in range(4)]
+    client.put(f"/api/tasks/{ids[1]}", json={"completed": True})
+
+    _, first = page(client, filter="pending", limit=2)
+    _, second = page(client, filter="pending", limit=2, cursor=first["next_cursor"])
+    pending = [task["id"] for task in first["tasks"] + second["tasks"]]
+    assert sorted(pending) == [ids[0], ids[2], ids[3]]
+
+
+def test_invalid_cursor(client):
+    assert page(client, cursor="not-a-cursor")[0] == 400
+    assert page(client, cursor="bm8tcGlwZQ==")[0] == 400  # base64 without the separator
+
+
+def test_limit_out_of_range(client):
+    assert page(client, limit=0)[0] == 400
+    assert page(client, limit=201)[0] == 400
+    assert page(client, limit="ten")[0] == 400
+    assert page(client, limit=200)[0] == 200
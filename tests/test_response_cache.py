@@ -0,0 +1,65 @@
+import gzip
+import json
+
+import pytest
+from flask import Flask
+
+from response_cache import MIN_COMPRESS_SIZE, encode_json, encoded_response
+
+
+@pytest.fixture
+def flask_app():
+    return Flask(__name__)
+
+
+def respond(flask_app, payload, accept_encoding=None):
+    headers = {"Accept-Encoding": accept_encoding} if accept_encoding is not None else {}
+    with flask_app.test_request_context(headers=headers):
+        return encoded_response(encode_json(payload))
+
+
+def large_payload():
+    return {"tasks": [{"id": i, "title": f"Task {i}"} for i in range(200)]}
+
+
+def test_gzip_when_accepted(flask_app):
+    payload = large_payload()
+    response = respond(flask_app, payload, "gzip, deflate")
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(response.get_data())) == payload
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+
+def test_identity_when_not_accepted(flask_app):
+    payload = large_payload()
+    for accept_encoding in (None, "identity", "deflate"):
+        response = respond(flask_app, payload, accept_encoding)
+        assert "Content-Encoding" not in response.headers
+        assert json.loads(response.get_data()) == payload
+        assert "Accept-Encoding" in response.headers["Vary"]
+
+
+def test_gzip_refused_with_zero_quality(flask_app):
+    response = respond(flask_app, large_payload(), "gzip;q=0, identity")
+    assert "Content-Encoding" not in response.headers
+
+
+def test_small_body_is_not_compressed(flask_app):
+    payload = {"tasks": []}
+    with flask_app.app_context():
+        assert len(encode_json(payload)["identity"]) < MIN_COMPRESS_SIZE
+    response = respond(flask_app, payload, "gzip, br")
+
+    assert "Content-Encoding" not in response.headers
+    assert json.loads(response.get_data()) == payload
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+
+def test_list_endpoint_serves_compressed_body(client, create_task):
+    for number in range(30):
+        create_task(f"Task {number}", "a description long enough to pass the compression threshold")
+    response = client.get("/api/tasks", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert len(json.loads(gzip.decompress(response.get_data()))["tasks"]) == 30
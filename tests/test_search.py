@@ -0,0 +1,61 @@
+IDENTITY = {"Accept-Encoding": "identity"}
+
+
+def search(client, **params):
+    response = client.get("/api/tasks/search", query_string=params, headers=IDENTITY)
+    return response.status_code, response.get_json()
+
+
+def titles(body):
+    return [task["title"] for task in body["tasks"]]
+
+
+def test_search_matches_word_prefixes_with_title_first(client, create_task):
+    create_task("Write report", "quarterly groceries budget")
+    create_task("Buy groceries", "milk and eggs")
+    create_task("Call mom")
+
+    status, body = search(client, q="grocer")
+    assert status == 200
+    assert titles(body) == ["Buy groceries", "Write report"]
+    assert body["truncated"] is False
+
+
+def test_search_filters_and_pages(client, create_task):
+    for number in range(3):
+        create_task(f"Report {number}")
+    done = create_task("Report done")
+    client.put(f"/api/tasks/{done}", json={"completed": True})
+
+    assert titles(search(client, q="report", filter="completed")[1]) == ["Report done"]
+
+    _, first = search(client, q="report", filter="pending", limit=2)
+    _, second = search(client, q="report", filter="pending", limit=2, cursor=first["next_cursor"])
+    assert len(first["tasks"]) == 2 and second["next_cursor"] is None
+    assert sorted(titles(first) + titles(second)) == ["Report 0", "Report 1", "Report 2"]
+
+
+def test_search_sees_writes(client, create_task):
+    task_id = create_task("Groom dog")
+    assert titles(search(client, q="groom")[1]) == ["Groom dog"]
+
+    client.put(f"/api/tasks/{task_id}", json={"title": "Walk cat"})
+    assert titles(search(client, q="groom")[1]) == []
+    assert titles(search(client, q="walk")[1]) == ["Walk cat"]
+
+
+def test_search_reports_truncated_ranking(client, app_module, create_task, monkeypatch):
+    monkeypatch.setattr(app_module.tasks_repo, "search_rank_window", 2)
+    create_task("Report one")
+    create_task("Report two")
+    assert search(client, q="report")[1]["truncated"] is False
+
+    create_task("Report three")
+    _, body = search(client, q="report")
+    assert body["truncated"] is True
+    assert len(body["tasks"]) == 2
+
+
+def test_search_requires_a_query(client):
+    assert search(client, q=" !? ")[0] == 400
+    assert search(client, q="x", cursor="bad")[0] == 400
@@ -0,0 +1,95 @@
+from email.utils import formatdate
+
+IDENTITY = {"Accept-Encoding": "identity"}
+
+
+def test_list_revalidates_with_version_etag(client, create_task):
+    create_task("First")
+    first = client.get("/api/tasks", headers=IDENTITY)
+    etag = first.headers["ETag"]
+
+    assert client.get("/api/tasks", headers={**IDENTITY, "If-None-Match": etag}).status_code == 304
+
+    create_task("Second")
+    response = client.get("/api/tasks", headers={**IDENTITY, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert len(response.get_json()["tasks"]) == 2
+
+
+def test_if_modified_since_alone_never_returns_stale_list(client, create_task):
+    # Both writes land within the same second of the task_clock timestamp
+    create_task("First")
+    first = client.get("/api/tasks", headers=IDENTITY)
+    assert "Last-Modified" not in first.headers
+    create_task("Second")
+
+    response = client.get("/api/tasks", headers={**IDENTITY, "If-Modified-Since": formatdate(usegmt=True)})
+    assert response.status_code == 200
+    assert len(response.get_json()["tasks"]) == 2
+
+
+def test_changes_since_sync_token(client, create_task):
+    kept = create_task("Kept")
+    removed = create_task("Removed")
+    token = client.get("/api/tasks", headers=IDENTITY).get_json()["sync_token"]
+
+    client.put(f"/api/tasks/{kept}", json={"completed": True})
+    client.delete(f"/api/tasks/{removed}")
+    added = create_task("Added")
+
+    delta = client.get(f"/api/tasks/changes?since={token}").get_json()
+    assert [task["id"] for task in delta["changed"]] == [kept, added]
+    assert delta["changed"][0]["completed"]
+    assert delta["deleted"] == [removed]
+
+    latest = client.get(f"/api/tasks/changes?since={delta['sync_token']}").get_json()
+    assert latest == {"changed": [], "deleted": [], "sync_token": delta["sync_token"]}
+
+
+def test_changes_rejects_bad_and_expired_tokens(client, app_module, create_task):
+    create_task()
+    assert client.get("/api/tasks/changes?since=abc").status_code == 400
+
+    with app_module.tasks_repo.pool.connection() as connection:
+        version = connection.execute("SELECT version FROM task_clock").fetchone()[0]
+        connection.execute("UPDATE task_clock SET pruned_version = ?", (version,))
+    try:
+        assert client.get(f"/api/tasks/changes?since={version - 1}").status_code == 410
+    finally:
+        with app_module.tasks_repo.pool.connection() as connection:
+            connection.execute("UPDATE task_clock SET pruned_version = 0")
+
+
+def test_changes_too_large_asks_for_reload(client, app_module, create_task, monkeypatch):
+    token = client.get("/api/tasks", headers=IDENTITY).get_json()["sync_token"]
+    create_task("One")
+    create_task("Two")
+    monkeypatch.setattr(app_module, "MAX_CHANGES", 1)
+
+    assert client.get(f"/api/tasks/changes?since={token}").status_code == 410
+
+
+def test_deletes_prune_expired_tombstones(client, app_module, create_task, monkeypatch):
+    repo = app_module.tasks_repo
+    old, recent = create_task("Old"), create_task("Recent")
+    client.delete(f"/api/tasks/{old}")
+    with repo.pool.connection() as connection:
+        connection.execute("UPDATE task_tombstones SET deleted_at = datetime('now', '-30 days')")
+    monkeypatch.setattr(repo, "_pruned_at", None)
+
+    client.delete(f"/api/tasks/{recent}")
+
+    with repo.pool.connection() as connection:
+        tombstones = [row[0] for row in connection.execute("SELECT id FROM task_tombstones")]
+        pruned_version = connection.execute("SELECT pruned_version FROM task_clock").fetchone()[0]
+        connection.execute("UPDATE task_clock SET pruned_version = 0")
+    assert tombstones == [recent]
+    assert pruned_version > 0
+
+    # Within prune_interval the next delete leaves tombstones alone
+    with repo.pool.connection() as connection:
+        connection.execute("UPDATE task_tombstones SET deleted_at = datetime('now', '-30 days')")
+    client.delete(f"/api/tasks/{create_task()}")
+    with repo.pool.connection() as connection:
+        assert connection.execute("SELECT COUNT(*) FROM task_tombstones").fetchone()[0] == 2
@@ -0,0 +1,118 @@
+import fcntl
+import os
+import threading
+import time
+
+import pytest
+from flask import Flask
+from flask_caching import Cache
+
+from task_cache import FILL_LOCK_FILES, GENERATION_KEY, TaskCache
+
+
+@pytest.fixture(params=["FileSystemCache", "SimpleCache"])
+def task_cache(request, tmp_path):
+    config = {"CACHE_TYPE": request.param, "CACHE_DEFAULT_TIMEOUT": 300}
+    lock_dir = None
+    if request.param == "FileSystemCache":
+        config["CACHE_DIR"] = str(tmp_path / "cache")
+        lock_dir = str(tmp_path / "locks")
+    cache = Cache(Flask(__name__), config=config)
+    return TaskCache(cache, lock_dir=lock_dir, lock_timeout=2.0)
+
+
+@pytest.fixture
+def file_cache(tmp_path):
+    cache = Cache(Flask(__name__), config={"CACHE_TYPE": "FileSystemCache", "CACHE_DIR": str(tmp_path / "cache")})
+    return TaskCache(cache, lock_dir=str(tmp_path / "locks"), lock_timeout=2.0)
+
+
+def hold_fill_lock(task_cache, key):
+    """Take the fill lock on a separate file description, as another worker would"""
+    fd = os.open(os.path.join(task_cache.lock_dir, f"{task_cache._fill_lock_name(key)}.lock"), os.O_RDWR | os.O_CREAT)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    return fd
+
+
+def release(fd):
+    fcntl.flock(fd, fcntl.LOCK_UN)
+    os.close(fd)
+
+
+def test_fill_then_hit(task_cache):
+    loads = []
+    loader = lambda: loads.append(1) or {"tasks": len(loads)}  # noqa: E731
+
+    assert task_cache.get_or_fill("tasks_all_page", loader) == ({"tasks": 1}, "fill")
+    assert task_cache.get_or_fill("tasks_all_page", loader) == ({"tasks": 1}, "hit")
+    assert len(loads) == 1
+
+
+def test_invalidate_turns_hit_into_miss(task_cache):
+    task_cache.get_or_fill("tasks_all_page", lambda: "old")
+    generation = task_cache.generation()
+
+    assert task_cache.invalidate() == generation + 1
+    assert task_cache.get_or_fill("tasks_all_page", lambda: "new") == ("new", "fill")
+
+
+def test_invalidate_is_seen_by_another_process(file_cache):
+    file_cache.get_or_fill("tasks_all_page", lambda: "old")
+
+    pid = os.fork()
+    if pid == 0:
+        os._exit(0 if file_cache.invalidate() else 1)
+    os.waitpid(pid, 0)
+
+    assert file_cache.get_or_fill("tasks_all_page", lambda: "new") == ("new", "fill")
+
+
+def test_serves_stale_while_another_process_fills(file_cache):
+    file_cache.get_or_fill("tasks_all_page", lambda: "old")
+    file_cache.invalidate()
+
+    fd = hold_fill_lock(file_cache, "tasks_all_page")
+    try:
+        value, source = file_cache.get_or_fill("tasks_all_page", lambda: pytest.fail("filled twice"))
+    finally:
+        release(fd)
+    assert (value, source) == ("old", "stale")
+
+
+def test_keep_stale_false_waits_for_the_fill(file_cache):
+    file_cache.get_or_fill("search_key", lambda: "old", keep_stale=False)
+    generation = file_cache.invalidate()
+
+    fd = hold_fill_lock(file_cache, "search_key")
+
+    def fill_elsewhere():
+        time.sleep(0.1)
+        file_cache.cache.set(f"search_key@{generation}", "new")
+        release(fd)
+
+    filler = threading.Thread(target=fill_elsewhere)
+    filler.start()
+    started = time.monotonic()
+    value, source = file_cache.get_or_fill("search_key", lambda: pytest.fail("filled twice"), keep_stale=False)
+    filler.join()
+
+    assert (value, source) == ("new", "hit")
+    assert time.monotonic() - started >= 0.1
+
+
+def test_pruned_generation_reseeds_higher(task_cache):
+    task_cache.invalidate()
+    generation = task_cache.generation()
+    task_cache.get_or_fill("tasks_all_page", lambda: "old")
+
+    task_cache.cache.delete(GENERATION_KEY)
+
+    assert task_cache.generation() > generation
+    assert task_cache.get_or_fill("tasks_all_page", lambda: "new") == ("new", "fill")
+
+
+def test_fill_lock_files_are_bounded(file_cache):
+    for i in range(500):
+        file_cache.get_or_fill(f"search_all_0_{i}", lambda: [i], keep_stale=False)
+
+    assert len(os.listdir(file_cache.lock_dir)) <= FILL_LOCK_FILES + 1  # plus generation.lock